@@ -3,7 +3,15 @@
 A comprehensive job finder using AI and web scraping technologies.
 """
 
-from .linkedin_parser import LinkedInJobParser, Job, JobRun, DatabaseManager
+from .linkedin_parser import Job, JobRun, DatabaseManager
 
 __version__ = "0.1.0"
-__all__ = ["LinkedInJobParser", "Job", "JobRun", "DatabaseManager"]
\ No newline at end of file
+__all__ = ["LinkedInJobParser", "Job", "JobRun", "DatabaseManager"]
+
+
+def __getattr__(name):
+    # Resolved lazily, like the linkedin_parser export it forwards
+    if name == "LinkedInJobParser":
+        from .linkedin_parser import LinkedInJobParser
+        return LinkedInJobParser
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -36,12 +36,25 @@ Minimum years of experience required:
 """
 
 
+_INTEGER_RE = re.compile(r'\b\d+\b')
+
+# Explicit year patterns, tried in order of specificity
+_YEAR_PATTERNS = tuple(re.compile(p) for p in (
+    r'(\d+)\+\s*years?\s+(?:of\s+)?experience',
+    r'minimum\s+(\d+)\s*years?',
+    r'at\s+least\s+(\d+)\s*years?',
+    r'(\d+)\s*-\s*\d+\s*years?\s+experience',
+    r'(\d+)\+\s*years?',
+    r'(\d+)\s*(?:to\s+\d+\s*)?years?\s+(?:of\s+)?experience',
+))
+
+
 class IntegerOutputParser(BaseOutputParser):
     """Parser to extract integer values from LLM responses."""
     
     def parse(self, text: str) -> int:
         """Parse integer from text, return -1 if not found."""
-        numbers = re.findall(r'\b\d+\b', text.strip())
+        numbers = _INTEGER_RE.findall(text.strip())
         if numbers:
             return int(numbers[0])
         return -1
@@ -80,18 +93,8 @@ class ExperienceExtractionChain:
         """Extract years using regex patterns and keywords."""
         content_lower = content.lower()
         
-        # Pattern for explicit years
-        year_patterns = [
-            r'(\d+)\+\s*years?\s+(?:of\s+)?experience',
-            r'minimum\s+(\d+)\s*years?',
-            r'at\s+least\s+(\d+)\s*years?',
-            r'(\d+)\s*-\s*\d+\s*years?\s+experience',
-            r'(\d+)\+\s*years?',
-            r'(\d+)\s*(?:to\s+\d+\s*)?years?\s+(?:of\s+)?experience'
-        ]
-        
-        for pattern in year_patterns:
-            matches = re.findall(pattern, content_lower)
+        for pattern in _YEAR_PATTERNS:
+            matches = pattern.findall(content_lower)
             if matches:
                 return int(matches[0])
         
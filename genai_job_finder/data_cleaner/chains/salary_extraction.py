@@ -32,6 +32,18 @@ Salary Information:
 """
 
 
+_NON_NUMERIC_RE = re.compile(r'[^\d.]')
+
+_SALARY_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*-\s*\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',
+    r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*to\s*\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',
+    r'\$(\d{1,3}(?:,\d{3})*)\s*k?\s*to\s*\$(\d{1,3}(?:,\d{3})*)\s*k?\s*(?:per\s+year|annually|/year)?',
+    r'(\d{1,3}(?:,\d{3})*)\s*k\s*-\s*(\d{1,3}(?:,\d{3})*)\s*k\s*(?:per\s+year|annually|/year)?',
+    r'(\d{1,3}(?:,\d{3})*)\s*k\s*to\s*(\d{1,3}(?:,\d{3})*)\s*k\s*(?:per\s+year|annually|/year)?',
+    r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)/yr\s*-\s*\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)/yr',
+))
+
+
 class SalaryOutputParser(BaseOutputParser):
     """Parser to extract salary information from LLM responses."""
     
@@ -49,12 +61,12 @@ class SalaryOutputParser(BaseOutputParser):
                 if line.startswith("MIN_SALARY:"):
                     value = line.split(":", 1)[1].strip()
                     if value.lower() not in ["null", "none", ""]:
-                        min_salary = float(re.sub(r'[^\d.]', '', value))
+                        min_salary = float(_NON_NUMERIC_RE.sub('', value))
                 
                 elif line.startswith("MAX_SALARY:"):
                     value = line.split(":", 1)[1].strip()
                     if value.lower() not in ["null", "none", ""]:
-                        max_salary = float(re.sub(r'[^\d.]', '', value))
+                        max_salary = float(_NON_NUMERIC_RE.sub('', value))
                 
                 elif line.startswith("CURRENCY:"):
                     value = line.split(":", 1)[1].strip()
@@ -111,17 +123,8 @@ class SalaryExtractionChain:
     
     def _extract_salary_with_regex(self, content: str) -> Optional[SalaryRange]:
         """Extract salary using regex patterns."""
-        patterns = [
-            r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*-\s*\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',
-            r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*to\s*\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',
-            r'\$(\d{1,3}(?:,\d{3})*)\s*k?\s*to\s*\$(\d{1,3}(?:,\d{3})*)\s*k?\s*(?:per\s+year|annually|/year)?',
-            r'(\d{1,3}(?:,\d{3})*)\s*k\s*-\s*(\d{1,3}(?:,\d{3})*)\s*k\s*(?:per\s+year|annually|/year)?',
-            r'(\d{1,3}(?:,\d{3})*)\s*k\s*to\s*(\d{1,3}(?:,\d{3})*)\s*k\s*(?:per\s+year|annually|/year)?',
-            r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)/yr\s*-\s*\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)/yr'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
+        for pattern in _SALARY_PATTERNS:
+            matches = pattern.findall(content)
             if matches:
                 min_str, max_str = matches[0]
                 try:
@@ -270,7 +270,7 @@ def search_jobs(search_query: str, location: str, max_pages: int,
                     job_details_url = parser.JOB_DETAILS_URL.format(job_id)
                     response = parser.session.get(job_details_url, timeout=15)
                     response.raise_for_status()
-                    soup = BeautifulSoup(response.text, "html.parser")
+                    soup = BeautifulSoup(response.content, "lxml")
                     
                     job_info = parser._extract_job_details(soup, job_id, 
                                                          datetime.now().date().isoformat(), 
@@ -4,10 +4,18 @@ This module provides functionality to scrape and parse job listings from LinkedI
 storing them in a database with run date tracking.
 """
 
-from .parser import LinkedInJobParser
 from .models import Job, JobRun
 from .database import DatabaseManager
 from .run_parser import main as run_parser
 
 __version__ = "0.1.0"
 __all__ = ["LinkedInJobParser", "Job", "JobRun", "DatabaseManager", "run_parser"]
+
+
+def __getattr__(name):
+    # LinkedInJobParser pulls in requests, bs4 and lxml; resolve it on first use so
+    # light submodule CLIs such as config_manager start without that import cost
+    if name == "LinkedInJobParser":
+        from .parser import LinkedInJobParser
+        return LinkedInJobParser
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
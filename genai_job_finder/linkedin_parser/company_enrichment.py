@@ -3,17 +3,27 @@ Company enrichment service for LinkedIn parser.
 Manages company information in a separate pipeline to avoid redundant parsing.
 """
 
+import asyncio
 import logging
-import time
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 
 from .models import Company
 from .database import DatabaseManager
 from .company_parser import LinkedInCompanyParser
+from .rate_limiter import host_rate_limiter
 
 logger = logging.getLogger(__name__)
 
+# Number of companies enriched concurrently; kept low to stay under LinkedIn rate limits
+DEFAULT_MAX_CONCURRENCY = 5
+
+# Companies written per transaction during bulk enrichment
+COMPANY_WRITE_BATCH_SIZE = 64
+
 
 @dataclass
 class CompanyEnrichmentResult:
@@ -39,6 +49,10 @@ class CompanyEnrichmentService:
         self.company_parser = LinkedInCompanyParser(database=self.database)
         self.enriched_count = 0
         self.failed_count = 0
+        # Company rows prefetched for the current enrichment batch, keyed by name
+        self._company_cache: Dict[str, Dict[str, Any]] = {}
+        # Companies queued for a batched write, counted once the batch is stored
+        self._queued_companies: List[str] = []
         
     def get_or_enrich_company(self, company_name: str, job_soup=None) -> CompanyEnrichmentResult:
         """
@@ -195,8 +209,6 @@ class CompanyEnrichmentService:
         Returns:
             Dictionary mapping company names to enrichment results
         """
-        import random
-        
         results = {}
         
         for i, company_name in enumerate(company_names):
@@ -211,12 +223,6 @@ class CompanyEnrichmentService:
                     result = self.get_or_enrich_company(company_name)
                 
                 results[company_name] = result
-                
-                # Add delay between company enrichments to be respectful
-                if i < len(company_names) - 1:  # Don't delay after the last one
-                    delay = 8  # 8 seconds between company enrichments
-                    logger.debug(f"Waiting {delay} seconds before next company...")
-                    time.sleep(delay)
                     
             except Exception as e:
                 logger.error(f"Error enriching company {company_name}: {e}")
@@ -246,10 +252,19 @@ class CompanyEnrichmentService:
         Returns:
             Dictionary with enrichment statistics
         """
-        all_companies = self.database.get_all_companies()
-        
-        total = len(all_companies)
-        enriched = len([c for c in all_companies if not self._needs_enrichment(c)])
+        # Counted in SQL rather than by loading every company row; a company is enriched
+        # when any key field is non-empty, matching _needs_enrichment
+        with self.database.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT COUNT(*),
+                       COUNT(CASE WHEN COALESCE(company_size, '') != ''
+                                    OR COALESCE(followers, '') != ''
+                                    OR COALESCE(industry, '') != ''
+                                    OR COALESCE(company_url, '') != '' THEN 1 END)
+                FROM companies
+            ''')
+            total, enriched = cursor.fetchone()
         needs_enrichment = total - enriched
         
         return {
@@ -260,126 +275,284 @@ class CompanyEnrichmentService:
         }
 
     # Legacy methods for compatibility with existing scripts
-    def get_companies_needing_enrichment_legacy(self) -> List[Dict[str, Any]]:
+    def get_companies_needing_enrichment_legacy(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get list of companies that need additional information (legacy compatibility)"""
+        query = '''
+            SELECT DISTINCT c.*, 
+                   COUNT(j.id) as job_count
+            FROM companies c
+            LEFT JOIN jobs j ON c.id = j.company_id
+            WHERE c.company_size IS NULL 
+               OR c.followers IS NULL 
+               OR c.industry IS NULL
+            GROUP BY c.id, c.company_name
+            ORDER BY job_count DESC, c.company_name
+        '''
+        params = ()
+        if limit:
+            query += ' LIMIT ?'
+            params = (limit,)
+        
         with self.database.get_connection() as conn:
             cursor = conn.cursor()
             
             # Get companies with missing information
-            cursor.execute('''
-                SELECT DISTINCT c.*, 
-                       COUNT(j.id) as job_count
-                FROM companies c
-                LEFT JOIN jobs j ON c.id = j.company_id
-                WHERE c.company_size IS NULL 
-                   OR c.followers IS NULL 
-                   OR c.industry IS NULL
-                GROUP BY c.id, c.company_name
-                ORDER BY job_count DESC, c.company_name
-            ''')
+            cursor.execute(query, params)
             
             return [dict(row) for row in cursor.fetchall()]
     
+    def count_companies_needing_enrichment(self) -> int:
+        """Count companies with missing information without loading their rows"""
+        with self.database.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT COUNT(*) FROM companies
+                WHERE company_size IS NULL 
+                   OR followers IS NULL 
+                   OR industry IS NULL
+            ''')
+            return cursor.fetchone()[0]
+    
     def get_all_companies(self) -> List[Dict[str, Any]]:
         """Get all companies in database"""
         return self.database.get_all_companies()
     
-    def get_companies_from_jobs(self) -> List[str]:
+    def get_companies_from_jobs(self, limit: Optional[int] = None) -> List[str]:
         """Get unique company names from jobs that don't have company records"""
+        query = '''
+            SELECT DISTINCT j.company
+            FROM jobs j
+            LEFT JOIN companies c ON j.company = c.company_name
+            WHERE c.id IS NULL
+            ORDER BY j.company
+        '''
+        params = ()
+        if limit:
+            query += ' LIMIT ?'
+            params = (limit,)
+        
         with self.database.get_connection() as conn:
             cursor = conn.cursor()
+            cursor.execute(query, params)
             
+            return [row[0] for row in cursor.fetchall()]
+    
+    def count_companies_from_jobs(self) -> int:
+        """Count unique company names from jobs that don't have company records"""
+        with self.database.get_connection() as conn:
+            cursor = conn.cursor()
             cursor.execute('''
-                SELECT DISTINCT j.company
+                SELECT COUNT(DISTINCT j.company)
                 FROM jobs j
                 LEFT JOIN companies c ON j.company = c.company_name
                 WHERE c.id IS NULL
-                ORDER BY j.company
             ''')
-            
-            return [row[0] for row in cursor.fetchall()]
+            return cursor.fetchone()[0]
     
-    def enrich_company_by_name(self, company_name: str, force: bool = False) -> bool:
+    def enrich_company_by_name(self, company_name: str, force: bool = False,
+                               existing: Optional[Dict[str, Any]] = None) -> bool:
         """Enrich a specific company by name (legacy compatibility)"""
-        import random
-        
         try:
             logger.info(f"Enriching company: {company_name}")
             
+            if existing is None:
+                existing = self.database.get_company_by_name(company_name)
+            
             # Check if company already has complete information
-            existing = self.database.get_company_by_name(company_name)
-            if existing and not force:
-                if all([existing.get('company_size'), existing.get('followers'), existing.get('industry')]):
-                    logger.info(f"Company {company_name} already has complete information")
-                    return True
+            if not force and self._has_complete_info(existing):
+                logger.info(f"Company {company_name} already has complete information")
+                return True
             
             # Try to get a recent job posting for this company to extract info
-            with self.database.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    SELECT job_posting_link 
-                    FROM jobs 
-                    WHERE company = ? 
-                    AND job_posting_link IS NOT NULL 
-                    AND job_posting_link != 'N/A'
-                    ORDER BY created_at DESC 
-                    LIMIT 1
-                ''', (company_name,))
-                
-                result = cursor.fetchone()
-                if not result:
-                    logger.warning(f"No job posting link found for {company_name}")
-                    return False
-                
-                job_link = result[0]
-                logger.info(f"Using job posting: {job_link}")
+            job_link = self._get_latest_job_link(company_name)
+            if not job_link:
+                logger.warning(f"No job posting link found for {company_name}")
+                return False
+            logger.info(f"Using job posting: {job_link}")
             
             # Fetch the job page and extract company info
+            host_rate_limiter(job_link).acquire()
             response = self.company_parser.session.get(job_link, timeout=15)
             response.raise_for_status()
             
             from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Extract and save company information
-            company_id = self.company_parser.parse_and_save_company(soup, company_name)
+            company_id = self.company_parser.parse_and_save_company(soup, company_name, existing)
             
-            if company_id:
-                self.enriched_count += 1
-                logger.info(f"✅ Successfully enriched: {company_name}")
+            return self._record_enrichment(company_name, company_id)
                 
-                # Add respectful delay
-                time.sleep(random.uniform(2, 5))
+        except Exception as e:
+            self.failed_count += 1
+            logger.error(f"❌ Error enriching {company_name}: {e}")
+            return False
+    
+    async def enrich_company_by_name_async(self, http_session, company_name: str, force: bool = False,
+                                           existing: Optional[Dict[str, Any]] = None) -> bool:
+        """Enrich a specific company by name using a shared aiohttp session"""
+        from bs4 import BeautifulSoup
+        
+        try:
+            logger.info(f"Enriching company: {company_name}")
+            
+            if existing is None:
+                existing = self.database.get_company_by_name(company_name)
+            
+            if not force and self._has_complete_info(existing):
+                logger.info(f"Company {company_name} already has complete information")
                 return True
-            else:
-                self.failed_count += 1
-                logger.warning(f"❌ Failed to enrich: {company_name}")
+            
+            job_link = self._get_latest_job_link(company_name)
+            if not job_link:
+                logger.warning(f"No job posting link found for {company_name}")
                 return False
+            logger.info(f"Using job posting: {job_link}")
+            
+            html = await self.company_parser.fetch_page_async(http_session, job_link)
+            
+            # BeautifulSoup parsing is CPU-bound; keep it off the event loop
+            loop = asyncio.get_running_loop()
+            soup = await loop.run_in_executor(None, BeautifulSoup, html, 'lxml')
+            
+            company_id = await self.company_parser.parse_and_save_company_async(
+                soup, company_name, http_session, existing
+            )
+            
+            if company_id is None and self.company_parser.company_batch_size > 1:
+                self._queued_companies.append(company_name)
+                return True
+            
+            return self._record_enrichment(company_name, company_id)
                 
         except Exception as e:
             self.failed_count += 1
             logger.error(f"❌ Error enriching {company_name}: {e}")
             return False
     
-    def enrich_all_companies(self, limit: int = None) -> Dict[str, int]:
+    def _has_complete_info(self, existing: Optional[Dict[str, Any]]) -> bool:
+        """Check whether a stored company already has size, followers and industry"""
+        return bool(existing) and all([
+            existing.get('company_size'), existing.get('followers'), existing.get('industry')
+        ])
+    
+    def _get_latest_job_link(self, company_name: str) -> Optional[str]:
+        """Get the most recent job posting link stored for a company"""
+        with self.database.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT job_posting_link 
+                FROM jobs 
+                WHERE company = ? 
+                AND job_posting_link IS NOT NULL 
+                AND job_posting_link != 'N/A'
+                ORDER BY created_at DESC 
+                LIMIT 1
+            ''', (company_name,))
+            
+            result = cursor.fetchone()
+            return result[0] if result else None
+    
+    def _record_enrichment(self, company_name: str, company_id: Optional[str]) -> bool:
+        """Update success/failure counters for an enrichment attempt"""
+        if company_id:
+            self.enriched_count += 1
+            logger.info(f"✅ Successfully enriched: {company_name}")
+            return True
+        
+        self.failed_count += 1
+        logger.warning(f"❌ Failed to enrich: {company_name}")
+        return False
+    
+    def enrich_all_companies(self, limit: int = None,
+                             max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> Dict[str, int]:
         """Enrich all companies that need additional information (legacy compatibility)"""
-        companies_to_enrich = self.get_companies_needing_enrichment_legacy()
+        companies_to_enrich = self.get_companies_needing_enrichment_legacy(limit=limit)
+        logger.info(f"Found {len(companies_to_enrich)} companies needing enrichment")
+        if not companies_to_enrich:
+            return self._enrichment_stats(0)
         
-        if limit:
-            companies_to_enrich = companies_to_enrich[:limit]
+        # Company page parsing is CPU-bound, so fan it out across cores for the batch; the pool
+        # is spawned before the event loop starts so workers never fork a multi-threaded process
+        workers = max(1, min(os.cpu_count() or 1, len(companies_to_enrich)))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as parse_pool:
+            return asyncio.run(self._enrich_companies_async(companies_to_enrich, max_concurrency, parse_pool))
+    
+    async def enrich_all_companies_async(self, limit: int = None,
+                                         max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                                         parse_executor: Optional[Executor] = None) -> Dict[str, int]:
+        """
+        Enrich companies concurrently over a single pooled aiohttp session.
         
+        Args:
+            limit: Maximum number of companies to process
+            max_concurrency: Maximum number of companies fetched at the same time
+            parse_executor: Executor for company page parsing; defaults to the loop's thread pool
+            
+        Returns:
+            Dictionary with processed, enriched and failed counts
+        """
+        companies_to_enrich = self.get_companies_needing_enrichment_legacy(limit=limit)
         logger.info(f"Found {len(companies_to_enrich)} companies needing enrichment")
+        if not companies_to_enrich:
+            return self._enrichment_stats(0)
         
-        for i, company in enumerate(companies_to_enrich, 1):
-            logger.info(f"Processing {i}/{len(companies_to_enrich)}: {company['company_name']}")
-            self.enrich_company_by_name(company['company_name'])
+        return await self._enrich_companies_async(companies_to_enrich, max_concurrency, parse_executor)
+    
+    async def _enrich_companies_async(self, companies_to_enrich: List[Dict[str, Any]], max_concurrency: int,
+                                      parse_executor: Optional[Executor]) -> Dict[str, int]:
+        """Enrich the given companies over one aiohttp session, parsing pages on parse_executor"""
+        import aiohttp
+        
+        total = len(companies_to_enrich)
+        
+        # Prefetch every company row once instead of looking each one up per task
+        self._company_cache = self.database.get_companies_by_names(
+            [company['company_name'] for company in companies_to_enrich]
+        )
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        processed = 0
+        
+        async def bounded(http_session, company_name: str):
+            nonlocal processed
+            async with semaphore:
+                await self.enrich_company_by_name_async(
+                    http_session, company_name, existing=self._company_cache.get(company_name)
+                )
             
+            processed += 1
             # Progress update every 5 companies
-            if i % 5 == 0:
-                logger.info(f"Progress: {i}/{len(companies_to_enrich)} - Success: {self.enriched_count}, Failed: {self.failed_count}")
+            if processed % 5 == 0:
+                logger.info(f"Progress: {processed}/{total} - Success: {self.enriched_count}, Failed: {self.failed_count}")
         
+        # One session shares pooled TCP/TLS connections across the whole batch
+        connector = aiohttp.TCPConnector(limit_per_host=max_concurrency)
+        timeout = aiohttp.ClientTimeout(total=15)
+        headers = dict(self.company_parser.session.headers)
+        # All database writes stay in this process
+        self.company_parser.parse_executor = parse_executor
+        # Queue company writes and commit them in chunks instead of one transaction per company
+        self.company_parser.company_batch_size = COMPANY_WRITE_BATCH_SIZE
+        try:
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers) as http_session:
+                await asyncio.gather(*[
+                    bounded(http_session, company['company_name']) for company in companies_to_enrich
+                ])
+        finally:
+            self.company_parser.parse_executor = None
+            self.company_parser.company_batch_size = 1
+            self.company_parser.flush_pending()
+            queued, self._queued_companies = self._queued_companies, []
+            for company_name in queued:
+                self._record_enrichment(company_name, self.company_parser.get_company_id(company_name))
+        
+        return self._enrichment_stats(total)
+    
+    def _enrichment_stats(self, total: int) -> Dict[str, int]:
+        """Counts reported by the bulk enrichment entry points"""
         return {
-            'total_processed': len(companies_to_enrich),
+            'total_processed': total,
             'enriched': self.enriched_count,
             'failed': self.failed_count
         }
@@ -387,40 +560,41 @@ class CompanyEnrichmentService:
     def create_missing_company_records(self) -> int:
         """Create basic company records for companies found in jobs but not in companies table"""
         missing_companies = self.get_companies_from_jobs()
-        created_count = 0
         
         logger.info(f"Found {len(missing_companies)} companies without records")
+        if not missing_companies:
+            return 0
         
-        for company_name in missing_companies:
-            try:
-                basic_company = Company(company_name=company_name)
-                self.database.save_company(basic_company)
-                created_count += 1
-                logger.info(f"Created basic record for: {company_name}")
-            except Exception as e:
-                logger.error(f"Error creating record for {company_name}: {e}")
-        
-        return created_count
+        try:
+            return self.database.save_companies_bulk(missing_companies)
+        except Exception as e:
+            logger.error(f"Error creating missing company records: {e}")
+            return 0
     
     def show_statistics(self):
         """Show company enrichment statistics"""
-        all_companies = self.get_all_companies()
-        companies_needing_enrichment = self.get_companies_needing_enrichment_legacy()
-        missing_companies = self.get_companies_from_jobs()
+        # One snapshot for all counts and lists, so the totals agree with each other
+        with self.database.session():
+            total_companies = self.database.get_company_count()
+            needing_enrichment_count = self.count_companies_needing_enrichment()
+            missing_count = self.count_companies_from_jobs()
+            
+            # Only the top 10 of each list are printed
+            companies_needing_enrichment = self.get_companies_needing_enrichment_legacy(limit=10)
+            missing_companies = self.get_companies_from_jobs(limit=10)
         
-        total_companies = len(all_companies)
-        complete_companies = total_companies - len(companies_needing_enrichment)
+        complete_companies = total_companies - needing_enrichment_count
         
         print("\n📊 Company Enrichment Statistics")
         print("=" * 50)
         print(f"Total companies in database: {total_companies}")
         print(f"Companies with complete info: {complete_companies}")
-        print(f"Companies needing enrichment: {len(companies_needing_enrichment)}")
-        print(f"Companies missing records: {len(missing_companies)}")
+        print(f"Companies needing enrichment: {needing_enrichment_count}")
+        print(f"Companies missing records: {missing_count}")
         
         if companies_needing_enrichment:
             print(f"\n🔍 Companies needing enrichment (top 10):")
-            for company in companies_needing_enrichment[:10]:
+            for company in companies_needing_enrichment:
                 missing_fields = []
                 if not company.get('company_size'):
                     missing_fields.append('size')
@@ -433,7 +607,7 @@ class CompanyEnrichmentService:
         
         if missing_companies:
             print(f"\n❌ Companies without records (top 10):")
-            for company in missing_companies[:10]:
+            for company in missing_companies:
                 print(f"  • {company}")
 
 
@@ -448,6 +622,8 @@ def main():
     parser.add_argument('--show-missing', action='store_true', help='Show companies that need enrichment')
     parser.add_argument('--create-missing', action='store_true', help='Create basic records for missing companies')
     parser.add_argument('--db-path', type=str, default='data/jobs.db', help='Path to database file')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_MAX_CONCURRENCY,
+                        help='Number of companies to enrich concurrently')
     
     args = parser.parse_args()
     
@@ -474,7 +650,7 @@ def main():
         else:
             # Enrich all companies
             logger.info("🚀 Starting company enrichment process...")
-            results = service.enrich_all_companies(args.limit)
+            results = service.enrich_all_companies(args.limit, args.concurrency)
             
             logger.info("\n📊 Enrichment Complete!")
             logger.info(f"Total processed: {results['total_processed']}")
@@ -489,6 +665,8 @@ def main():
         logger.info("\n⏹️  Process interrupted by user")
     except Exception as e:
         logger.error(f"❌ Unexpected error: {e}")
+    finally:
+        service.database.close()
 
 
 if __name__ == "__main__":
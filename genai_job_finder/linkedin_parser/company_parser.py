@@ -1,18 +1,331 @@
+import asyncio
 import logging
 import re
-import time
-import random
-from typing import Optional
-from urllib.parse import urljoin
+import threading
+from concurrent.futures import Executor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit, urlunsplit
 
 import requests
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, Tag
 
+from .config import ACCEPT_ENCODING
 from .models import Company
 from .database import DatabaseManager
+from .html_tree import build_tree, joined_text, node_attr, node_text, page_text, select
+from .page_cache import PageCache
+from .rate_limiter import host_rate_limiter, mount_retrying_adapter, retry_after_seconds
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns shared by job-page and company-page extraction
+_VIEW_ALL_EMPLOYEES_RE = re.compile(r'View all ([\d,]+) employees?', re.IGNORECASE)
+_FOLLOWERS_RE = re.compile(r'([\d,]+(?:\.\d+)?[KMB]?)\s+followers?', re.IGNORECASE)
+_EMPLOYEES_OR_FOLLOWERS_RE = re.compile(r'\d+\s+(employees?|followers?)', re.IGNORECASE)
+
+# Literal anchor for _FOLLOWERS_RE: matches "followers"/"Followers" so the regex
+# only runs in a window around each hit instead of from every offset of the page
+_FOLLOWERS_NEEDLE = 'ollower'
+_FOLLOWERS_WINDOW_BEFORE = 128
+_FOLLOWERS_WINDOW_AFTER = 16
+
+# Single-pass fallback scans for "N employees" and "N followers". Size alternatives are listed in
+# priority order, so a match's group number is its rank; the whole alternation sits in a zero-width
+# lookahead so every offset is tried and overlapping candidates are never swallowed by an earlier match.
+_VIEW_ALL_SIZE = r'View all (?P<view_all>[\d,]+) employees?'
+_RANGE_SIZE = r'(?P<range>\d{1,3}(?:,\d{3})*(?:-\d{1,3}(?:,\d{3})*)?)\s+employees?'
+_SCALED_SIZE = r'(?P<scaled>\d+(?:\.\d+)?[KMB]?)\s+employees?'
+_LABELLED_SIZE = r'Company size[:\s]*(?P<labelled>\d{1,3}(?:,\d{3})*(?:-\d{1,3}(?:,\d{3})*)?)'
+_FOLLOWERS_SCAN = r'(?P<followers>[\d,]+(?:\.\d+)?[KMB]?)\s+followers?'
+
+
+def _compile_size_scan(*size_alternatives: str) -> re.Pattern:
+    """Lookahead scan over the size alternatives (highest priority first) plus followers"""
+    return re.compile('(?=' + '|'.join(size_alternatives + (_FOLLOWERS_SCAN,)) + ')', re.IGNORECASE)
+
+
+_JOB_PAGE_SCAN_RE = _compile_size_scan(
+    _VIEW_ALL_SIZE, _RANGE_SIZE, _SCALED_SIZE, _LABELLED_SIZE + r'\s+employees?'
+)
+# Company pages may also label the size range without the word "employees", ahead of K/M/B counts
+_COMPANY_PAGE_SCAN_RE = _compile_size_scan(_VIEW_ALL_SIZE, _RANGE_SIZE, _LABELLED_SIZE, _SCALED_SIZE)
+
+# Company link selectors in priority order, combined so the document is walked once
+_COMPANY_LINK_SELECTORS = (
+    # Modern LinkedIn job page selectors
+    "a[href*='/company/'][data-tracking-control-name*='public_jobs_topcard']",
+    "a[href*='/company/'][data-tracking-control-name*='company']",
+    ".jobs-unified-top-card__company-name a[href*='/company/']",
+    ".job-details-jobs-unified-top-card__company-name a[href*='/company/']",
+    ".jobs-details__main-content a[href*='/company/']",
+    "[data-test-id*='company'] a[href*='/company/']",
+    
+    # Fallback selectors for different page layouts
+    "a[href*='/company/']",
+    ".topcard__org-name-link",
+    ".top-card-layout__card a[href*='/company/']",
+    "a[data-tracking-control-name='public_jobs_topcard-org-name']",
+    ".jobs-company__company-name a[href*='/company/']",
+    
+    # Additional modern selectors
+    "[data-entity-urn*='company'] a[href*='/company/']",
+    ".job-details-jobs-unified-top-card a[href*='/company/']",
+    ".jobs-unified-top-card a[href*='/company/']",
+)
+_COMPANY_LINK_SELECTOR = ", ".join(_COMPANY_LINK_SELECTORS)
+_COMPANY_LINK_PATTERNS = tuple(soupsieve.compile(selector) for selector in _COMPANY_LINK_SELECTORS)
+
+# Follower-specific elements, only consulted when the page text has no "N followers"
+_FOLLOWER_SELECTORS = (
+    "[data-tracking-control-name*='follower']",
+    ".org-top-card-summary__follower-count",
+)
+
+# about-us data-test-ids read directly into the extracted info
+_ABOUT_US_FIELDS = {
+    'about-us__size': 'company_size',
+    'about-us__industry': 'industry',
+}
+
+# Older company page layouts that expose the industry outside the about-us fields
+_INDUSTRY_FALLBACK_SELECTORS = (
+    ".org-top-card-summary__industry",
+    "[data-test='company-industry']",
+    "*[class*='industry']",
+)
+
+# Maximum number of parsed company pages kept in memory per parser instance
+_COMPANY_PAGE_CACHE_SIZE = 1024
+
+# Company pages are streamed and reading stops once every field we extract has been seen,
+# or once the byte cap is hit (either HTML parser copes with the truncated document)
+_STREAM_CHUNK_SIZE = 16384
+_MAX_COMPANY_PAGE_BYTES = 1_000_000
+_COMPANY_PAGE_SECTIONS = (b'about-us__size', b'about-us__industry')
+_FOLLOWERS_BYTES_RE = re.compile(rb'[\d,]+(?:\.\d+)?[KMB]?\s+followers?', re.IGNORECASE)
+
+# Statuses LinkedIn uses to signal throttling, and how often to retry them
+_RATE_LIMIT_STATUSES = (429, 503)
+_MAX_FETCH_ATTEMPTS = 3
+
+
+def _scan_size_and_followers(pattern: re.Pattern, page_text: str, info: dict):
+    """
+    Fill missing company_size/followers in info from one finditer pass over page_text.
+    
+    Followers take the first match; the size comes from the first match of the highest-priority
+    alternative that occurs anywhere, like searching for each alternative in turn.
+    """
+    need_size = not info['company_size']
+    size_rank = None
+    size_value = None
+    for match in pattern.finditer(page_text):
+        kind = match.lastgroup
+        if kind == 'followers':
+            if not info['followers']:
+                info['followers'] = f"{match.group(kind)} followers"
+                logger.debug("Found followers via fallback pattern: %s", match.group(kind))
+        elif need_size and (size_rank is None or match.lastindex < size_rank):
+            size_rank = match.lastindex
+            size_value = match.group(kind)
+        
+        # Group 1 is the top-priority size alternative; nothing later can beat it
+        if info['followers'] and (not need_size or size_rank == 1):
+            break
+    
+    if size_value is not None:
+        count = size_value.replace(',', '')
+        info['company_size'] = f"{count} employees"
+        logger.debug("Found employee count via fallback pattern: %s", count)
+
+
+def _company_link_priority(element: Tag) -> int:
+    """Index of the first company link selector that matches element"""
+    return next(i for i, pattern in enumerate(_COMPANY_LINK_PATTERNS) if pattern.match(element))
+
+
+def _normalize_company_url(url: str) -> str:
+    """Canonical form of a company URL for cache keys: lowercase host, no query, fragment or trailing slash"""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path.rstrip('/'), '', ''))
+
+
+class _CompanyPageStream:
+    """
+    Accumulates a streamed company page and tracks, incrementally, whether the size and industry
+    sections have closed and a follower count has appeared, so each chunk is scanned only once.
+    """
+
+    # Enough bytes to catch a marker or follower count split across two chunks
+    _OVERLAP = 64
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self._section_starts: Dict[bytes, int] = {}
+        self._open_sections = set(_COMPANY_PAGE_SECTIONS)
+        self._has_followers = False
+
+    def feed(self, chunk: bytes) -> bool:
+        """Append chunk and return True once reading can stop"""
+        scan_from = max(0, len(self.buffer) - self._OVERLAP)
+        self.buffer += chunk
+        
+        for marker in list(self._open_sections):
+            if marker not in self._section_starts:
+                position = self.buffer.find(marker, scan_from)
+                if position == -1:
+                    continue
+                self._section_starts[marker] = position
+            if self.buffer.find(b'</dd>', max(scan_from, self._section_starts[marker])) != -1:
+                self._open_sections.discard(marker)
+        
+        if not self._has_followers:
+            self._has_followers = _FOLLOWERS_BYTES_RE.search(self.buffer, scan_from) is not None
+        
+        complete = not self._open_sections and self._has_followers
+        return complete or len(self.buffer) > _MAX_COMPANY_PAGE_BYTES
+
+
+def _search_followers(text: str):
+    """_FOLLOWERS_RE.search restricted to windows around the literal needle"""
+    idx = text.find(_FOLLOWERS_NEEDLE)
+    while idx != -1:
+        match = _FOLLOWERS_RE.search(
+            text, max(0, idx - _FOLLOWERS_WINDOW_BEFORE), idx + _FOLLOWERS_WINDOW_AFTER
+        )
+        if match:
+            return match
+        idx = text.find(_FOLLOWERS_NEEDLE, idx + len(_FOLLOWERS_NEEDLE))
+    # All-caps text is rare; keep the case-insensitive behaviour for it
+    if 'OLLOWER' in text:
+        return _FOLLOWERS_RE.search(text)
+    return None
+
+
+def _find_followers(tree, text: str, info: dict):
+    """Set info['followers'] from the first follower count in the page text, else from follower-specific elements"""
+    match = _search_followers(text)
+    if match:
+        info['followers'] = f"{match.group(1)} followers"
+        logger.debug("Found followers in page text: %s", match.group(1))
+        return
+    
+    for selector in _FOLLOWER_SELECTORS:
+        for element in select(tree, selector):
+            match = _FOLLOWERS_RE.search(node_text(element))
+            if match:
+                info['followers'] = f"{match.group(1)} followers"
+                logger.debug("Found followers via %s: %s", selector, match.group(1))
+                return
+
+
+def _about_section_text(fields: list) -> Optional[str]:
+    """Text of the container around the about-us fields, or None if the page has none"""
+    if not fields:
+        return None
+    
+    # The data-test-id elements are the individual fields; their section sits two levels up
+    section = fields[0]
+    for _ in range(2):
+        if section.parent is not None:
+            section = section.parent
+    return joined_text(section)
+
+
+def _scan_text_for_size_and_followers(tree, about_fields: list, pattern: re.Pattern, info: dict):
+    """
+    Fill followers and fallback size from page text, scanning only the about section when present
+    and reifying the whole document's text only if that leaves something missing.
+    """
+    about_text = _about_section_text(about_fields)
+    text = about_text if about_text is not None else page_text(tree)
+    
+    _find_followers(tree, text, info)
+    if not info['company_size'] or not info['followers']:
+        _scan_size_and_followers(pattern, text, info)
+    if (not info['company_size'] or not info['followers']) and about_text is not None:
+        _scan_size_and_followers(pattern, page_text(tree), info)
+
+
+def _parse_company_page(html: bytes) -> Optional[dict]:
+    """Extract size, followers and industry from a company page's HTML (top-level so it can run in a process pool)"""
+    info = _extract_about_fields(build_tree(html), _COMPANY_PAGE_SCAN_RE, industry_fallback=True)
+    return info if any(info.values()) else None
+
+
+def _extract_about_fields(tree, scan_pattern: re.Pattern, industry_fallback: bool = False) -> dict:
+    """
+    Extract size, followers and industry from a job or company page.
+    
+    Args:
+        tree: Lexbor tree or BeautifulSoup document
+        scan_pattern: Fused size/followers pattern for the text fallback
+        industry_fallback: Also try old-style industry selectors (company pages)
+        
+    Returns:
+        Dictionary with company_size, followers and industry (None when not found)
+    """
+    info = {
+        'company_size': None,
+        'followers': None,
+        'industry': None
+    }
+    
+    # PRIORITY 1: Use LinkedIn's specific data-test-id selectors (most reliable)
+    logger.debug("Attempting extraction using LinkedIn data-test-id selectors...")
+    
+    # One walk collects every about-us field; the first of each data-test-id wins
+    about_fields = select(tree, '[data-test-id^="about-us__"]')
+    seen_test_ids = set()
+    for field in about_fields:
+        test_id = node_attr(field, 'data-test-id')
+        key = _ABOUT_US_FIELDS.get(test_id)
+        if not key or test_id in seen_test_ids:
+            continue
+        seen_test_ids.add(test_id)
+        
+        dd = select(field, 'dd')
+        value = node_text(dd[0]) if dd else ''
+        # Company size from about-us__size, industry from about-us__industry
+        if value and (key != 'industry' or len(value) > 2):
+            info[key] = value
+            logger.debug("Found %s via data-test-id: %s", key, value)
+    
+    # PRIORITY 2: Face-pile exact employee count (if data-test-id didn't work or for more precise count)
+    if not info['company_size'] or "employees" not in info['company_size']:
+        for element in select(tree, ".face-pile__text"):
+            text = node_text(element)
+            # Look for "View all X employees" pattern
+            match = _VIEW_ALL_EMPLOYEES_RE.search(text)
+            if match:
+                count = match.group(1).replace(',', '')
+                info['company_size'] = f"{count} employees"
+                logger.debug("Found exact employee count via face-pile: %s", count)
+                break
+    
+    # PRIORITY 3 and 4: Followers, then size/followers fallback patterns, over the about section first
+    _scan_text_for_size_and_followers(tree, about_fields, scan_pattern, info)
+    
+    # PRIORITY 4: Industry fallback if the data-test-id selector didn't work
+    if industry_fallback and not info['industry']:
+        # Try old-style industry selectors as fallback
+        for selector in _INDUSTRY_FALLBACK_SELECTORS:
+            try:
+                elements = select(tree, selector)
+                if elements:
+                    industry = node_text(elements[0])
+                    if not _EMPLOYEES_OR_FOLLOWERS_RE.search(industry):
+                        if industry and len(industry) > 2 and len(industry) < 100:
+                            info['industry'] = industry
+                            logger.debug("Found industry via fallback %s: %s", selector, industry)
+                            break
+            except Exception as e:
+                logger.debug("Error with fallback industry selector %s: %s", selector, e)
+                continue
+    
+    return info
+
 
 class LinkedInCompanyParser:
     """LinkedIn company information parser"""
@@ -21,49 +334,101 @@ class LinkedInCompanyParser:
         self.database = database or DatabaseManager()
         self.session = requests.Session()
         self._setup_session()
+        # Parsed company page info keyed by company URL; subsidiaries often share one page
+        self._company_page_cache: Dict[str, Optional[dict]] = {}
+        # Raw company pages persisted next to the database so repeated runs skip the network
+        self.page_cache = PageCache(self.database.db_path.parent / 'company_cache')
+        # Ids of companies known to exist, keyed by company name; shared with job detail worker threads
+        self._company_ids: Dict[str, str] = {}
+        self._company_ids_lock = threading.Lock()
+        # In-flight async company page fetches keyed by URL
+        self._company_page_pending: Dict[str, asyncio.Future] = {}
+        # Companies queued for one batched write; 1 writes each company immediately
+        self.company_batch_size = 1
+        self._pending_companies: List[Company] = []
+        # Executor for company page parsing on the async path; None uses the loop's default thread pool
+        self.parse_executor: Optional[Executor] = None
     
     def _setup_session(self):
-        """Setup requests session with proper headers"""
+        """Setup requests session with proper headers and a retrying connection pool"""
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
             'Cache-Control': 'max-age=0',
         }
         self.session.headers.update(headers)
+        mount_retrying_adapter(self.session)
     
     def extract_company_info_from_job_page(self, soup: BeautifulSoup, company_name: str) -> Optional[Company]:
         """Extract company information from a job posting page"""
         try:
-            company_info = {
-                'company_name': company_name,
-                'company_size': None,
-                'followers': None,
-                'industry': None,
-                'company_url': None
-            }
+            company_info, job_page_info = self._read_job_page(soup, company_name)
             
-            # Try to find company link first
-            company_link = self._extract_company_link(soup)
-            if company_link:
-                company_info['company_url'] = company_link
-                logger.info(f"Found company link for {company_name}: {company_link}")
-                # If we have a company link, try to get detailed info from company page
-                detailed_info = self._get_company_page_info(company_link)
+            # Only visit the company page when the job page left something missing
+            if company_info['company_url'] and not all(job_page_info.values()):
+                detailed_info = self._get_company_page_info(company_info['company_url'])
                 if detailed_info:
                     company_info.update(detailed_info)
-            else:
-                logger.debug(f"No company link found for {company_name}")
 
-            # If we couldn't get detailed info, try to extract from job page itself
-            if not company_info['company_size'] or not company_info['followers']:
-                job_page_info = self._extract_company_info_from_job_page_content(soup)
-                for key, value in job_page_info.items():
-                    if value and not company_info[key]:
-                        company_info[key] = value
+            return self._build_company(company_info, job_page_info)
+            
+        except Exception as e:
+            logger.error(f"Error extracting company info for {company_name}: {e}")
+            return None
+    
+    async def extract_company_info_from_job_page_async(self, soup: BeautifulSoup, company_name: str,
+                                                       http_session) -> Optional[Company]:
+        """Async variant of extract_company_info_from_job_page using a shared aiohttp session"""
+        try:
+            company_info, job_page_info = self._read_job_page(soup, company_name)
+            
+            if company_info['company_url'] and not all(job_page_info.values()):
+                detailed_info = await self._get_company_page_info_async(http_session, company_info['company_url'])
+                if detailed_info:
+                    company_info.update(detailed_info)
+            
+            return self._build_company(company_info, job_page_info)
+            
+        except Exception as e:
+            logger.error(f"Error extracting company info for {company_name}: {e}")
+            return None
+    
+    def _read_job_page(self, soup: BeautifulSoup, company_name: str) -> Tuple[dict, dict]:
+        """Get the company link and the company details the job page itself carries"""
+        company_info = {
+            'company_name': company_name,
+            'company_size': None,
+            'followers': None,
+            'industry': None,
+            'company_url': None
+        }
+        
+        # Try to find company link first
+        company_link = self._extract_company_link(soup)
+        if company_link:
+            company_info['company_url'] = company_link
+            logger.info(f"Found company link for {company_name}: {company_link}")
+        else:
+            logger.debug("No company link found for %s", company_name)
+        
+        job_page_info = self._extract_company_info_from_job_page_content(soup)
+        if company_link and all(job_page_info.values()):
+            logger.debug("Job page has size, followers and industry for %s; skipping company page", company_name)
+        
+        return company_info, job_page_info
+    
+    def _build_company(self, company_info: dict, job_page_info: dict) -> Optional[Company]:
+        """Fill gaps from the job page content and build a Company if anything was found"""
+        company_name = company_info['company_name']
+        try:
+            # Company page details win; the job page fills whatever is still missing
+            for key, value in job_page_info.items():
+                if value and not company_info[key]:
+                    company_info[key] = value
 
             # Create Company object if we have at least some information (including just company_url)
             if any([company_info['company_size'], company_info['followers'], 
@@ -76,7 +441,7 @@ class LinkedInCompanyParser:
                     company_url=company_info['company_url']
                 )
             
-            logger.debug(f"No company information found for {company_name}")
+            logger.debug("No company information found for %s", company_name)
             return None
             
         except Exception as e:
@@ -86,47 +451,27 @@ class LinkedInCompanyParser:
     def _extract_company_link(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract company profile link from job page"""
         try:
-            # Updated selectors for LinkedIn's current HTML structure
-            selectors = [
-                # Modern LinkedIn job page selectors
-                "a[href*='/company/'][data-tracking-control-name*='public_jobs_topcard']",
-                "a[href*='/company/'][data-tracking-control-name*='company']",
-                ".jobs-unified-top-card__company-name a[href*='/company/']",
-                ".job-details-jobs-unified-top-card__company-name a[href*='/company/']",
-                ".jobs-details__main-content a[href*='/company/']",
-                "[data-test-id*='company'] a[href*='/company/']",
-                
-                # Fallback selectors for different page layouts
-                "a[href*='/company/']",
-                ".topcard__org-name-link",
-                ".top-card-layout__card a[href*='/company/']",
-                "a[data-tracking-control-name='public_jobs_topcard-org-name']",
-                ".jobs-company__company-name a[href*='/company/']",
-                
-                # Additional modern selectors
-                "[data-entity-urn*='company'] a[href*='/company/']",
-                ".job-details-jobs-unified-top-card a[href*='/company/']",
-                ".jobs-unified-top-card a[href*='/company/']"
+            # One pass over the document for every selector, then honour selector priority
+            candidates = [
+                element for element in soup.select(_COMPANY_LINK_SELECTOR)
+                if '/company/' in (element.get('href') or '')
             ]
-            
-            for selector in selectors:
-                elements = soup.select(selector)
-                for element in elements:
-                    if element and element.get('href'):
-                        href = element.get('href')
-                        if '/company/' in href:
-                            # Clean up the URL and ensure it's valid
-                            href = href.split('?')[0]  # Remove query parameters
-                            href = href.split('#')[0]  # Remove fragments
-                            
-                            # Ensure it's a full URL
-                            if href.startswith('http'):
-                                logger.debug(f"Found company link: {href}")
-                                return href
-                            else:
-                                full_url = urljoin('https://www.linkedin.com', href)
-                                logger.debug(f"Found company link (relative): {href} -> {full_url}")
-                                return full_url
+            if candidates:
+                # min() is stable, so ties keep document order like the old per-selector loop
+                best = min(candidates, key=_company_link_priority)
+                href = best.get('href')
+                # Clean up the URL and ensure it's valid
+                href = href.split('?')[0]  # Remove query parameters
+                href = href.split('#')[0]  # Remove fragments
+                
+                # Ensure it's a full URL
+                if href.startswith('http'):
+                    logger.debug("Found company link: %s", href)
+                    return href
+                else:
+                    full_url = urljoin('https://www.linkedin.com', href)
+                    logger.debug("Found company link (relative): %s -> %s", href, full_url)
+                    return full_url
             
             logger.debug("No company link found with any selector")
             return None
@@ -137,305 +482,227 @@ class LinkedInCompanyParser:
     
     def _extract_company_info_from_job_page_content(self, soup: BeautifulSoup) -> dict:
         """Extract company info directly from job page content using LinkedIn's specific data-test-id attributes"""
-        info = {
-            'company_size': None,
-            'followers': None,
-            'industry': None
-        }
-        
         try:
-            # PRIORITY 1: Use LinkedIn's specific data-test-id selectors (most reliable)
-            logger.debug("Attempting extraction using LinkedIn data-test-id selectors...")
-            
-            # Company size from data-test-id="about-us__size"
-            size_section = soup.find(attrs={"data-test-id": "about-us__size"})
-            if size_section:
-                size_dd = size_section.find("dd")
-                if size_dd:
-                    size_text = size_dd.get_text().strip()
-                    # Clean up the text and extract meaningful size info
-                    if size_text and len(size_text) > 0:
-                        info['company_size'] = size_text
-                        logger.debug(f"Found company size via data-test-id: {size_text}")
-            
-            # Industry from data-test-id="about-us__industry" 
-            industry_section = soup.find(attrs={"data-test-id": "about-us__industry"})
-            if industry_section:
-                industry_dd = industry_section.find("dd")
-                if industry_dd:
-                    industry_text = industry_dd.get_text().strip()
-                    if industry_text and len(industry_text) > 2:
-                        info['industry'] = industry_text
-                        logger.debug(f"Found industry via data-test-id: {industry_text}")
-            
-            # PRIORITY 2: Face-pile exact employee count (more precise than ranges)
-            if not info['company_size'] or "employees" not in info['company_size']:
-                face_pile_elements = soup.select(".face-pile__text")
-                for element in face_pile_elements:
-                    text = element.get_text().strip()
-                    # Look for "View all X employees" pattern
-                    match = re.search(r'View all ([\d,]+) employees?', text, re.IGNORECASE)
-                    if match:
-                        count = match.group(1).replace(',', '')
-                        info['company_size'] = f"{count} employees"
-                        logger.debug(f"Found exact employee count via face-pile: {count}")
-                        break
-            
-            # PRIORITY 3: Followers from h3 elements or follower-specific selectors
-            follower_selectors = [
-                "h3",  # User mentioned h3 elements contain follower info
-                "[data-tracking-control-name*='follower']",
-                ".org-top-card-summary__follower-count", 
-                "*[class*='follower']"
-            ]
-            
-            for selector in follower_selectors:
-                try:
-                    elements = soup.select(selector)
-                    for element in elements:
-                        text = element.get_text().strip()
-                        # Look for follower patterns
-                        match = re.search(r'([\d,]+(?:\.\d+)?[KMB]?)\s+followers?', text, re.IGNORECASE)
-                        if match:
-                            info['followers'] = f"{match.group(1)} followers"
-                            logger.debug(f"Found followers via {selector}: {match.group(1)}")
-                            break
-                    if info['followers']:
-                        break
-                except Exception as e:
-                    logger.debug(f"Error with follower selector {selector}: {e}")
-                    continue
-            
-            # PRIORITY 4: Fallback patterns for any missed data
-            if not info['company_size'] or not info['followers']:
-                page_text = soup.get_text()
-                
-                # Company size fallback patterns
-                if not info['company_size']:
-                    size_patterns = [
-                        r'View all ([\d,]+) employees?',
-                        r'(\d{1,3}(?:,\d{3})*(?:-\d{1,3}(?:,\d{3})*)?)\s+employees?',
-                        r'(\d+(?:\.\d+)?[KMB]?)\s+employees?',
-                        r'Company size[:\s]*(\d{1,3}(?:,\d{3})*(?:-\d{1,3}(?:,\d{3})*)?)\s+employees?'
-                    ]
-                    
-                    for pattern in size_patterns:
-                        match = re.search(pattern, page_text, re.IGNORECASE)
-                        if match:
-                            count = match.group(1).replace(',', '')
-                            info['company_size'] = f"{count} employees"
-                            logger.debug(f"Found employee count via fallback pattern: {count}")
-                            break
-                
-                # Followers fallback patterns
-                if not info['followers']:
-                    follower_patterns = [
-                        r'([\d,]+(?:\.\d+)?[KMB]?)\s+followers?',
-                        r'Follow[^0-9]*([\d,]+(?:\.\d+)?[KMB]?)\s+followers?'
-                    ]
-                    
-                    for pattern in follower_patterns:
-                        match = re.search(pattern, page_text, re.IGNORECASE)
-                        if match:
-                            info['followers'] = f"{match.group(1)} followers"
-                            logger.debug(f"Found followers via fallback pattern: {match.group(1)}")
-                            break
-            
-            # PRIORITY 5: Additional LinkedIn-specific data-test-id attributes for comprehensive extraction
-            # Check for other useful company info
-            additional_selectors = [
-                ("about-us__headquarters", "headquarters"),
-                ("about-us__organizationType", "organization_type"), 
-                ("about-us__foundedOn", "founded"),
-                ("about-us__specialties", "specialties")
-            ]
-            
-            for test_id, field_name in additional_selectors:
-                try:
-                    section = soup.find(attrs={"data-test-id": test_id})
-                    if section:
-                        dd_element = section.find("dd")
-                        if dd_element:
-                            value = dd_element.get_text().strip()
-                            if value:
-                                logger.debug(f"Found {field_name} via data-test-id: {value}")
-                                # We could store these in future expansion
-                except Exception as e:
-                    logger.debug(f"Error extracting {field_name}: {e}")
-                    continue
-            
+            return _extract_about_fields(soup, _JOB_PAGE_SCAN_RE)
         except Exception as e:
             logger.warning(f"Error extracting company info from job page: {e}")
-        
-        return info
+            return {'company_size': None, 'followers': None, 'industry': None}
     
     def _get_company_page_info(self, company_url: str) -> Optional[dict]:
         """Get detailed company information from LinkedIn company page using specific data-test-id selectors"""
+        company_url = _normalize_company_url(company_url)
+        if company_url in self._company_page_cache:
+            logger.debug("Using cached company page info: %s", company_url)
+            return self._company_page_cache[company_url]
+        
         try:
-            logger.info(f"Fetching company page: {company_url}")
-            response = self.session.get(company_url, timeout=15)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            info = {
-                'company_size': None,
-                'followers': None,
-                'industry': None
-            }
-            
-            # PRIORITY 1: Use LinkedIn's specific data-test-id selectors (most reliable)
-            logger.debug("Attempting company page extraction using LinkedIn data-test-id selectors...")
+            html = self.page_cache.get(company_url)
+            if html is not None:
+                logger.info(f"Company page cache hit: {company_url}")
+                info = _parse_company_page(html)
+                self._cache_company_page(company_url, info)
+                return info
             
-            # Company size from data-test-id="about-us__size"
-            size_section = soup.find(attrs={"data-test-id": "about-us__size"})
-            if size_section:
-                size_dd = size_section.find("dd")
-                if size_dd:
-                    size_text = size_dd.get_text().strip()
-                    if size_text and len(size_text) > 0:
-                        info['company_size'] = size_text
-                        logger.debug(f"Found company size via data-test-id: {size_text}")
-            
-            # Industry from data-test-id="about-us__industry"
-            industry_section = soup.find(attrs={"data-test-id": "about-us__industry"})
-            if industry_section:
-                industry_dd = industry_section.find("dd")
-                if industry_dd:
-                    industry_text = industry_dd.get_text().strip()
-                    if industry_text and len(industry_text) > 2:
-                        info['industry'] = industry_text
-                        logger.debug(f"Found industry via data-test-id: {industry_text}")
-            
-            # PRIORITY 2: Face-pile exact employee count (if data-test-id didn't work or for more precise count)
-            if not info['company_size'] or "employees" not in info['company_size']:
-                face_pile_elements = soup.select(".face-pile__text")
-                for element in face_pile_elements:
-                    text = element.get_text().strip()
-                    # Look for "View all X employees" pattern
-                    match = re.search(r'View all ([\d,]+) employees?', text, re.IGNORECASE)
-                    if match:
-                        count = match.group(1).replace(',', '')
-                        info['company_size'] = f"{count} employees"
-                        logger.debug(f"Found exact employee count via face-pile: {count}")
+            logger.info(f"Fetching company page: {company_url}")
+            # Only waits when requests to this host have used up their burst allowance
+            host_rate_limiter(company_url).acquire()
+            with self.session.get(company_url, timeout=15, stream=True) as response:
+                response.raise_for_status()
+                page = _CompanyPageStream()
+                for chunk in response.iter_content(chunk_size=_STREAM_CHUNK_SIZE):
+                    if page.feed(chunk):
                         break
+                html = bytes(page.buffer)
+            self.page_cache.put(company_url, html)
             
-            # PRIORITY 3: Followers from h3 elements and other follower selectors
-            follower_selectors = [
-                "h3",  # User mentioned h3 elements contain follower info
-                "[data-tracking-control-name*='follower']",
-                ".org-top-card-summary__follower-count",
-                "*[class*='follower']",
-                ".artdeco-button--secondary"
-            ]
+            info = _parse_company_page(html)
+            self._cache_company_page(company_url, info)
             
-            for selector in follower_selectors:
-                try:
-                    elements = soup.select(selector)
-                    for element in elements:
-                        text = element.get_text().strip()
-                        match = re.search(r'([\d,]+(?:\.\d+)?[KMB]?)\s+followers?', text, re.IGNORECASE)
-                        if match:
-                            info['followers'] = f"{match.group(1)} followers"
-                            logger.debug(f"Found followers via {selector}: {match.group(1)}")
-                            break
-                    if info['followers']:
-                        break
-                except Exception as e:
-                    logger.debug(f"Error with follower selector {selector}: {e}")
-                    continue
+            return info
             
-            # PRIORITY 4: Fallback extraction if data-test-id selectors didn't work
-            if not info['company_size'] or not info['followers'] or not info['industry']:
-                page_text = soup.get_text()
-                
-                # Company size fallback
-                if not info['company_size']:
-                    size_patterns = [
-                        r'View all ([\d,]+) employees?',
-                        r'(\d{1,3}(?:,\d{3})*(?:-\d{1,3}(?:,\d{3})*)?)\s+employees?',
-                        r'Company size[:\s]*(\d{1,3}(?:,\d{3})*(?:-\d{1,3}(?:,\d{3})*)?)',
-                        r'(\d+(?:\.\d+)?[KMB]?)\s+employees?'
-                    ]
-                    
-                    for pattern in size_patterns:
-                        match = re.search(pattern, page_text, re.IGNORECASE)
-                        if match:
-                            count = match.group(1).replace(',', '')
-                            info['company_size'] = f"{count} employees"
-                            logger.debug(f"Found company size via fallback pattern: {count}")
-                            break
-                
-                # Followers fallback
-                if not info['followers']:
-                    followers_patterns = [
-                        r'([\d,]+(?:\.\d+)?[KMB]?)\s+followers?',
-                        r'Follow[^0-9]*([\d,]+(?:\.\d+)?[KMB]?)\s+followers?'
-                    ]
-                    
-                    for pattern in followers_patterns:
-                        match = re.search(pattern, page_text, re.IGNORECASE)
-                        if match:
-                            info['followers'] = f"{match.group(1)} followers"
-                            logger.debug(f"Found followers via fallback pattern: {match.group(1)}")
-                            break
-                
-                # Industry fallback
-                if not info['industry']:
-                    # Try old-style industry selectors as fallback
-                    industry_selectors = [
-                        ".org-top-card-summary__industry",
-                        "[data-test='company-industry']",
-                        "*[class*='industry']"
-                    ]
-                    
-                    for selector in industry_selectors:
-                        try:
-                            element = soup.select_one(selector)
-                            if element:
-                                industry = element.get_text().strip()
-                                if not re.search(r'\d+\s+(employees?|followers?)', industry, re.IGNORECASE):
-                                    if industry and len(industry) > 2 and len(industry) < 100:
-                                        info['industry'] = industry
-                                        logger.debug(f"Found industry via fallback {selector}: {industry}")
-                                        break
-                        except Exception as e:
-                            logger.debug(f"Error with fallback industry selector {selector}: {e}")
-                            continue
+        except Exception as e:
+            logger.warning(f"Error fetching company page {company_url}: {e}")
+            # Remember the failure so other jobs from this employer don't retry it within the run
+            self._cache_company_page(company_url, None)
+            return None
+    
+    async def _get_company_page_info_async(self, http_session, company_url: str) -> Optional[dict]:
+        """Fetch a company page through a shared aiohttp session and parse it off the event loop"""
+        company_url = _normalize_company_url(company_url)
+        if company_url in self._company_page_cache:
+            logger.debug("Using cached company page info: %s", company_url)
+            return self._company_page_cache[company_url]
+        
+        # Concurrent tasks for companies sharing a page wait on the first fetch instead of repeating it
+        pending = self._company_page_pending.get(company_url)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch_company_page_info_async(http_session, company_url))
+            self._company_page_pending[company_url] = pending
+            pending.add_done_callback(lambda _: self._company_page_pending.pop(company_url, None))
+        else:
+            logger.debug("Waiting on in-flight company page fetch: %s", company_url)
+        return await asyncio.shield(pending)
+    
+    async def _fetch_company_page_info_async(self, http_session, company_url: str) -> Optional[dict]:
+        """Fetch, parse and cache a single company page"""
+        try:
+            html = self.page_cache.get(company_url)
+            if html is not None:
+                logger.info(f"Company page cache hit: {company_url}")
+            else:
+                logger.info(f"Fetching company page: {company_url}")
+                html = await self.fetch_page_async(http_session, company_url, stop_early=True)
+                self.page_cache.put(company_url, html)
             
-            # Add longer delay to be more respectful and avoid rate limiting
-            time.sleep(random.uniform(5, 10))
+            loop = asyncio.get_running_loop()
+            info = await loop.run_in_executor(self.parse_executor, _parse_company_page, html)
+            self._cache_company_page(company_url, info)
             
-            return info if any(info.values()) else None
+            return info
             
         except Exception as e:
             logger.warning(f"Error fetching company page {company_url}: {e}")
+            # Remember the failure so other jobs from this employer don't retry it within the run
+            self._cache_company_page(company_url, None)
             return None
     
-    def parse_and_save_company(self, soup: BeautifulSoup, company_name: str) -> Optional[str]:
-        """Parse company information and save to database"""
+    async def fetch_page_async(self, http_session, url: str, stop_early: bool = False) -> bytes:
+        """
+        GET a page through the shared rate limiter, backing off when LinkedIn throttles us.
+        
+        Args:
+            http_session: Shared aiohttp ClientSession
+            url: Page to fetch
+            stop_early: Stream a company page and stop reading once size, industry and followers are in
+            
+        Returns:
+            Raw page body
+        """
+        # Shared by all concurrent fetches so politeness holds across the whole batch
+        rate_limiter = host_rate_limiter(url)
+        for attempt in range(_MAX_FETCH_ATTEMPTS):
+            await rate_limiter.acquire_async()
+            async with http_session.get(url) as response:
+                if response.status in _RATE_LIMIT_STATUSES and attempt < _MAX_FETCH_ATTEMPTS - 1:
+                    delay = retry_after_seconds(response.headers.get('Retry-After'), attempt)
+                    logger.warning(f"Rate limited ({response.status}) on {url}, pausing {delay:.1f}s")
+                    rate_limiter.pause(delay)
+                    continue
+                response.raise_for_status()
+                if not stop_early:
+                    return await response.read()
+                
+                page = _CompanyPageStream()
+                async for chunk in response.content.iter_chunked(_STREAM_CHUNK_SIZE):
+                    if page.feed(chunk):
+                        break
+                return bytes(page.buffer)
+    
+    def _cache_company_page(self, company_url: str, info: Optional[dict]):
+        """Remember parsed company page info, evicting the oldest entry when full"""
+        if len(self._company_page_cache) >= _COMPANY_PAGE_CACHE_SIZE:
+            self._company_page_cache.pop(next(iter(self._company_page_cache)), None)
+        self._company_page_cache[company_url] = info
+    
+    def parse_and_save_company(self, soup: BeautifulSoup, company_name: str,
+                               existing_company: Optional[dict] = None) -> Optional[str]:
+        """Parse company information and save to database
+        
+        existing_company may carry a row the caller already fetched, skipping the lookup.
+        Returns None on failure or while the company waits in a batched write.
+        """
         try:
             # Check if company already exists
-            existing_company = self.database.get_company_by_name(company_name)
-            if existing_company:
-                logger.debug(f"Company {company_name} already exists in database")
-                return existing_company['id']
+            company_id = self._existing_company_id(company_name, existing_company)
+            if company_id:
+                logger.debug("Company %s already exists in database", company_name)
+                return company_id
             
             # Extract company information
             company = self.extract_company_info_from_job_page(soup, company_name)
-            if company:
-                company_id = self.database.save_company(company)
-                logger.info(f"Saved company information for: {company_name}")
-                return company_id
-            else:
-                logger.debug(f"No additional company information found for: {company_name}")
-                # Still create a basic company record
-                basic_company = Company(company_name=company_name)
-                company_id = self.database.save_company(basic_company)
+            return self._save_extracted_company(company_name, company)
+                
+        except Exception as e:
+            logger.error(f"Error parsing and saving company {company_name}: {e}")
+            return None
+    
+    async def parse_and_save_company_async(self, soup: BeautifulSoup, company_name: str,
+                                           http_session, existing_company: Optional[dict] = None) -> Optional[str]:
+        """Async variant of parse_and_save_company; database writes stay on the calling thread"""
+        try:
+            company_id = self._existing_company_id(company_name, existing_company)
+            if company_id:
+                logger.debug("Company %s already exists in database", company_name)
                 return company_id
+            
+            company = await self.extract_company_info_from_job_page_async(soup, company_name, http_session)
+            return self._save_extracted_company(company_name, company)
                 
         except Exception as e:
             logger.error(f"Error parsing and saving company {company_name}: {e}")
             return None
+    
+    def _existing_company_id(self, company_name: str, existing_company: Optional[dict] = None) -> Optional[str]:
+        """Get the id of a stored company, remembering it so repeat employers skip the database lookup"""
+        company_id = self.cached_company_id(company_name)
+        if company_id:
+            return company_id
+        
+        if existing_company is None:
+            existing_company = self.database.get_company_by_name(company_name)
+        if existing_company:
+            self.remember_company_id(company_name, existing_company['id'])
+            return existing_company['id']
+        return None
+    
+    def cached_company_id(self, company_name: str) -> Optional[str]:
+        """Get a company id remembered in this session without touching the database"""
+        with self._company_ids_lock:
+            return self._company_ids.get(company_name)
+    
+    def remember_company_id(self, company_name: str, company_id: str):
+        """Remember the stored id of a company for later lookups"""
+        with self._company_ids_lock:
+            self._company_ids[company_name] = company_id
+    
+    def _save_extracted_company(self, company_name: str, company: Optional[Company]) -> Optional[str]:
+        """Save extracted company information, falling back to a basic record
+        
+        Returns None while the company is queued for a batched write; its id is
+        known once flush_pending has stored it.
+        """
+        if not company:
+            logger.debug("No additional company information found for: %s", company_name)
+            # Still create a basic company record
+            company = Company(company_name=company_name)
+        
+        if self.company_batch_size > 1:
+            # The upsert keeps an existing row's id, so the client-side id is not handed out
+            self._pending_companies.append(company)
+            if len(self._pending_companies) >= self.company_batch_size:
+                self.flush_pending()
+            return None
+        
+        company_id = self.database.save_company(company)
+        logger.info(f"Saved company information for: {company_name}")
+        self.remember_company_id(company_name, company_id)
+        return company_id
+    
+    def flush_pending(self) -> int:
+        """Write companies queued by batched saves in one transaction and remember their stored ids"""
+        if not self._pending_companies:
+            return 0
+        
+        pending, self._pending_companies = self._pending_companies, []
+        saved = self.database.save_companies(pending)
+        stored = self.database.get_companies_by_names([c.company_name for c in pending])
+        for company_name, row in stored.items():
+            self.remember_company_id(company_name, row['id'])
+        return saved
+    
+    def get_company_id(self, company_name: str) -> Optional[str]:
+        """Get the stored id of a company, or None if it has not been written yet"""
+        return self._existing_company_id(company_name)
 
 
 def main():
@@ -1,12 +1,18 @@
 import os
 from dataclasses import dataclass
+from importlib.util import find_spec
 from typing import Optional, List, Dict, Union
 
 
+# requests/urllib3 and aiohttp only decode Brotli when one of these is installed;
+# never advertise an encoding we can't decode, and prefer Brotli (smaller HTML) when we can
+BROTLI_AVAILABLE = any(find_spec(module) for module in ("brotli", "brotlicffi"))
+ACCEPT_ENCODING = "br, gzip, deflate" if BROTLI_AVAILABLE else "gzip, deflate"
+
 HEADERS: Dict[str, str] = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
     "Accept-Language": "en-US,en;q=0.9",
-    "Accept-Encoding": "gzip, deflate, br",
+    "Accept-Encoding": ACCEPT_ENCODING,
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8",
     "Connection": "keep-alive",
     "Upgrade-Insecure-Requests": "1",
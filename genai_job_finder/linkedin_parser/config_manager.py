@@ -24,97 +24,108 @@ class ConfigManager:
     
     def show_current_config(self):
         """Display current configuration"""
-        print("🔧 CURRENT LINKEDIN PARSER CONFIGURATION")
-        print("=" * 50)
-        print()
+        config = self.config
+        lines = []
+        lines.append("🔧 CURRENT LINKEDIN PARSER CONFIGURATION")
+        lines.append("=" * 50)
+        lines.append("")
         
         # Show the active search parameters from config
         try:
-            base_search_params = self.config.get_search_params()
-            print("📊 CURRENT SEARCH PARAMETERS (from config.py):")
-            print(f"   🔍 Search Query: {base_search_params.keywords}")
-            print(f"   📍 Location: {base_search_params.location}")
-            print(f"   📊 Total Jobs: {base_search_params.total_jobs}")
-            print(f"   ⏰ Time Filter: {base_search_params.time_filter}")
-            print(f"   🏠 Remote: {'Yes' if base_search_params.remote else 'No'}")
-            print(f"   ⏰ Part-time: {'Yes' if base_search_params.parttime else 'No'}")
+            base_search_params = config.get_search_params()
+            lines.append("📊 CURRENT SEARCH PARAMETERS (from config.py):")
+            lines.append(f"   🔍 Search Query: {base_search_params.keywords}")
+            lines.append(f"   📍 Location: {base_search_params.location}")
+            lines.append(f"   📊 Total Jobs: {base_search_params.total_jobs}")
+            lines.append(f"   ⏰ Time Filter: {base_search_params.time_filter}")
+            lines.append(f"   🏠 Remote: {'Yes' if base_search_params.remote else 'No'}")
+            lines.append(f"   ⏰ Part-time: {'Yes' if base_search_params.parttime else 'No'}")
         except ValueError:
-            print("📊 SEARCH PARAMETERS:")
-            print("   ❌ No search configurations found in LINKEDIN_JOB_SEARCH_PARAMS")
-            print("   💡 Please add at least one SearchParams entry to config.py")
-        print()
+            lines.append("📊 SEARCH PARAMETERS:")
+            lines.append("   ❌ No search configurations found in LINKEDIN_JOB_SEARCH_PARAMS")
+            lines.append("   💡 Please add at least one SearchParams entry to config.py")
+        lines.append("")
         
-        print("🗃️ DATABASE & EXPORT:")
-        print(f"   💾 Database Path: {self.config.database_path}")
-        print(f"   📤 CSV Export Path: {self.config.export_csv_path}")
-        print()
+        lines.append("🗃️ DATABASE & EXPORT:")
+        lines.append(f"   💾 Database Path: {config.database_path}")
+        lines.append(f"   📤 CSV Export Path: {config.export_csv_path}")
+        lines.append("")
         
-        print("🕸️ SCRAPING SETTINGS:")
-        print(f"   🖥️ Headless Browser: {'Yes' if self.config.headless_browser else 'No'}")
-        print(f"   ⏱️ Page Timeout: {self.config.page_timeout}s")
-        print(f"   📄 Max Pages: {self.config.max_pages_per_search}")
-        print(f"   ⏳ Request Delay: {self.config.delay_between_requests}s")
-        print()
+        lines.append("🕸️ SCRAPING SETTINGS:")
+        lines.append(f"   🖥️ Headless Browser: {'Yes' if config.headless_browser else 'No'}")
+        lines.append(f"   ⏱️ Page Timeout: {config.page_timeout}s")
+        lines.append(f"   📄 Max Pages: {config.max_pages_per_search}")
+        lines.append(f"   ⏳ Request Delay: {config.delay_between_requests}s")
+        lines.append("")
         
-        print("🔍 PREDEFINED SEARCH CONFIGURATIONS:")
+        lines.append("🔍 PREDEFINED SEARCH CONFIGURATIONS:")
         for i, search_param in enumerate(LINKEDIN_JOB_SEARCH_PARAMS, 1):
-            print(f"   {i}. {search_param.keywords} in {search_param.location}")
-            print(f"      Time: {search_param.time_filter}, Remote: {search_param.remote}, "
-                  f"Part-time: {search_param.parttime}, Jobs: {search_param.total_jobs}")
-        print()
+            lines.append(f"   {i}. {search_param.keywords} in {search_param.location}")
+            lines.append(f"      Time: {search_param.time_filter}, Remote: {search_param.remote}, "
+                         f"Part-time: {search_param.parttime}, Jobs: {search_param.total_jobs}")
+        lines.append("")
         
-        print("⏰ AVAILABLE TIME FILTERS:")
+        lines.append("⏰ AVAILABLE TIME FILTERS:")
         for name, code in TIME_FILTERS.items():
-            print(f"   {name}: {code}")
+            lines.append(f"   {name}: {code}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def show_env_variables(self):
         """Show how to set environment variables to customize config"""
-        print("🌍 CONFIGURATION SETUP")
-        print("=" * 50)
-        print()
-        print("📝 SEARCH PARAMETERS are now configured in config.py file:")
-        print("   Edit LINKEDIN_JOB_SEARCH_PARAMS list in genai_job_finder/linkedin_parser/config.py")
-        print("   The first entry in the list becomes your default search configuration.")
-        print()
-        print("🌍 ENVIRONMENT VARIABLES for system settings:")
-        print()
-        print("# Database and export:")
-        print(f'export JOB_DB_PATH="{self.config.database_path}"')
-        print(f'export EXPORT_CSV_PATH="{self.config.export_csv_path}"')
-        print()
-        print("# Scraping settings:")
-        print(f'export HEADLESS_BROWSER="{str(self.config.headless_browser).lower()}"')
-        print(f'export PAGE_TIMEOUT="{self.config.page_timeout}"')
-        print(f'export MAX_PAGES="{self.config.max_pages_per_search}"')
-        print(f'export REQUEST_DELAY="{self.config.delay_between_requests}"')
-        print()
-        print("# Logging:")
-        print(f'export LOG_LEVEL="{self.config.log_level}"')
-        if self.config.log_file:
-            print(f'export LOG_FILE="{self.config.log_file}"')
-        print()
-        print("💡 TIP: Add these to your ~/.bashrc or ~/.zshrc for persistence")
+        config = self.config
+        lines = []
+        lines.append("🌍 CONFIGURATION SETUP")
+        lines.append("=" * 50)
+        lines.append("")
+        lines.append("📝 SEARCH PARAMETERS are now configured in config.py file:")
+        lines.append("   Edit LINKEDIN_JOB_SEARCH_PARAMS list in genai_job_finder/linkedin_parser/config.py")
+        lines.append("   The first entry in the list becomes your default search configuration.")
+        lines.append("")
+        lines.append("🌍 ENVIRONMENT VARIABLES for system settings:")
+        lines.append("")
+        lines.append("# Database and export:")
+        lines.append(f'export JOB_DB_PATH="{config.database_path}"')
+        lines.append(f'export EXPORT_CSV_PATH="{config.export_csv_path}"')
+        lines.append("")
+        lines.append("# Scraping settings:")
+        lines.append(f'export HEADLESS_BROWSER="{str(config.headless_browser).lower()}"')
+        lines.append(f'export PAGE_TIMEOUT="{config.page_timeout}"')
+        lines.append(f'export MAX_PAGES="{config.max_pages_per_search}"')
+        lines.append(f'export REQUEST_DELAY="{config.delay_between_requests}"')
+        lines.append("")
+        lines.append("# Logging:")
+        lines.append(f'export LOG_LEVEL="{config.log_level}"')
+        if config.log_file:
+            lines.append(f'export LOG_FILE="{config.log_file}"')
+        lines.append("")
+        lines.append("💡 TIP: Add these to your ~/.bashrc or ~/.zshrc for persistence")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def generate_makefile_examples(self):
         """Show Makefile usage examples"""
-        print("🔨 MAKEFILE USAGE EXAMPLES")
-        print("=" * 50)
-        print()
-        print("# Use current config.py defaults:")
-        print("make run-parser")
-        print()
-        print("# Override specific parameters:")
-        print('make run-parser QUERY="Software Engineer" LOCATION="Austin" JOBS=100')
-        print('make run-parser QUERY="Data Analyst" LOCATION="Remote" REMOTE=true')
-        print('make run-parser QUERY="Product Manager" LOCATION="San Francisco" PARTTIME=true')
-        print()
-        print("# Common searches:")
-        print('make run-parser QUERY="Machine Learning Engineer" LOCATION="United States" REMOTE=true JOBS=200')
-        print('make run-parser QUERY="DevOps Engineer" LOCATION="Texas" JOBS=75')
-        print('make run-parser QUERY="Python Developer" LOCATION="California" REMOTE=true JOBS=150')
-        print()
-        print("💡 Default values come from the first entry in LINKEDIN_JOB_SEARCH_PARAMS in config.py")
-        print("💡 Command line parameters override config.py values when provided")
+        lines = []
+        lines.append("🔨 MAKEFILE USAGE EXAMPLES")
+        lines.append("=" * 50)
+        lines.append("")
+        lines.append("# Use current config.py defaults:")
+        lines.append("make run-parser")
+        lines.append("")
+        lines.append("# Override specific parameters:")
+        lines.append('make run-parser QUERY="Software Engineer" LOCATION="Austin" JOBS=100')
+        lines.append('make run-parser QUERY="Data Analyst" LOCATION="Remote" REMOTE=true')
+        lines.append('make run-parser QUERY="Product Manager" LOCATION="San Francisco" PARTTIME=true')
+        lines.append("")
+        lines.append("# Common searches:")
+        lines.append('make run-parser QUERY="Machine Learning Engineer" LOCATION="United States" REMOTE=true JOBS=200')
+        lines.append('make run-parser QUERY="DevOps Engineer" LOCATION="Texas" JOBS=75')
+        lines.append('make run-parser QUERY="Python Developer" LOCATION="California" REMOTE=true JOBS=150')
+        lines.append("")
+        lines.append("💡 Default values come from the first entry in LINKEDIN_JOB_SEARCH_PARAMS in config.py")
+        lines.append("💡 Command line parameters override config.py values when provided")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
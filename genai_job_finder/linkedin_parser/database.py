@@ -1,45 +1,185 @@
+import csv
 import sqlite3
+import threading
+import time
 from contextlib import contextmanager
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
 import logging
 
 from .models import Job, JobRun, Company
 
+# pandas is imported only inside get_all_jobs_as_dataframe: this module is loaded by
+# every CLI entry point (via the package __init__), and most of them never build a DataFrame
+
 
 logger = logging.getLogger(__name__)
 
+# Per-connection tuning; journal_mode=WAL is persistent and set once in _initialize_database
+_CONNECTION_PRAGMAS = (
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA cache_size=-65536',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+)
+
+# Insert a company or merge non-null fields into the existing record with its name
+_UPSERT_COMPANY_SQL = '''
+    INSERT INTO companies (
+        id, company_name, company_size, followers, industry, company_url
+    ) VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(company_name) DO UPDATE SET
+        company_size = COALESCE(excluded.company_size, company_size),
+        followers = COALESCE(excluded.followers, followers),
+        industry = COALESCE(excluded.industry, industry),
+        company_url = COALESCE(excluded.company_url, company_url),
+        updated_at = CURRENT_TIMESTAMP
+'''
+
+# Database directories already created in this process; skips a mkdir per DatabaseManager
+_ENSURED_DIRS: Set[Path] = set()
+
+# Columns added to jobs after its first release, all TEXT, in the order they were introduced
+_MIGRATED_JOB_COLUMNS = (
+    'location', 'work_location_type', 'company_id', 'company_size',
+    'company_followers', 'company_industry', 'company_info_link',
+)
+
+# Bump when _migrate_tables gains a step; stored in PRAGMA user_version
+_SCHEMA_VERSION = 1
+
+# Column order shared by single and batched job inserts; matches Job.to_dict
+_JOB_COLUMNS = (
+    'id', 'company', 'title', 'location', 'work_location_type',
+    'level', 'salary_range', 'content', 'employment_type', 'job_function',
+    'industries', 'posted_time', 'applicants', 'job_id', 'date',
+    'parsing_link', 'job_posting_link', 'run_id', 'company_id',
+    'company_size', 'company_followers', 'company_industry', 'company_info_link',
+)
+
+# Job columns returned by CSV export and the DataFrame reader, in output order
+_EXPORT_COLUMNS = (
+    'id', 'company', 'title', 'location', 'work_location_type', 'level', 'salary_range', 'content',
+    'employment_type', 'job_function', 'industries', 'posted_time',
+    'applicants', 'job_id', 'date', 'parsing_link', 'job_posting_link',
+    'company_size', 'company_followers', 'company_industry', 'company_info_link',
+)
+_EXPORT_JOBS_SQL = f"SELECT {', '.join(_EXPORT_COLUMNS)} FROM jobs ORDER BY created_at DESC"
+_EXPORT_JOBS_BY_RUN_SQL = (
+    f"SELECT {', '.join(_EXPORT_COLUMNS)} FROM jobs WHERE run_id = ? ORDER BY created_at DESC"
+)
+
+# Reads _JOB_COLUMNS straight off a Job (its to_dict keys are its attribute names)
+# in one C-level call, without building the intermediate dict
+_job_values = attrgetter(*_JOB_COLUMNS)
+
+# Duplicates are dropped by the jobs primary key instead of a lookup per row
+_INSERT_JOBS_IGNORE_SQL = (
+    f"INSERT OR IGNORE INTO jobs ({', '.join(_JOB_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_JOB_COLUMNS))})"
+)
+
 
 class DatabaseManager:
     """Manages database operations for job data - matches legacy structure"""
     
     def __init__(self, db_path: str = "data/jobs.db"):
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.db_path.parent not in _ENSURED_DIRS:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            _ENSURED_DIRS.add(self.db_path.parent)
+        # One connection is kept open for the manager's lifetime; the lock keeps
+        # each get_connection block's transaction to a single thread at a time
+        self._conn_lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_depth = 0
         self._initialize_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open and tune the shared connection"""
+        # Autocommit at the driver level: single statements commit on their own and
+        # multi-statement writes say where their transaction starts via batch_transaction.
+        # The connection serves every statement shape in this module plus the enrichment
+        # and pandas queries, so a larger statement cache keeps them all prepared.
+        conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None, cached_statements=256
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        # Recommended on open for long-lived connections: refresh stale or missing
+        # planner statistics with a bounded analysis; close() finishes with PRAGMA optimize
+        conn.execute('PRAGMA optimize=0x10002')
+        return conn
+    
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            conn.close()
+        """Context manager for the shared database connection, committing on success"""
+        with self._conn_lock:
+            if self._conn is None:
+                self._conn = self._connect()
+            conn = self._conn
+            # Blocks nested inside a session() join its transaction instead of ending it
+            self._conn_depth += 1
+            try:
+                yield conn
+                if self._conn_depth == 1:
+                    conn.commit()
+            except Exception as e:
+                if self._conn_depth == 1:
+                    conn.rollback()
+                raise e
+            finally:
+                self._conn_depth -= 1
+    
+    @contextmanager
+    def batch_transaction(self):
+        """Context manager running the enclosed writes in one BEGIN IMMEDIATE ... COMMIT"""
+        with self.get_connection() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield conn
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            conn.execute('COMMIT')
+    
+    @contextmanager
+    def session(self):
+        """Run several reader calls on the shared connection inside one read transaction.
+        
+        The calls see a single consistent snapshot and other threads wait until the block exits.
+        Writes that open their own transaction (batch_transaction) must not run inside it.
+        """
+        with self.get_connection() as conn:
+            conn.execute('BEGIN')
+            try:
+                yield self
+            finally:
+                conn.execute('COMMIT')
+    
+    def close(self):
+        """Close the shared connection; a later call to get_connection reopens it"""
+        with self._conn_lock:
+            if self._conn is None:
+                return
+            # Let SQLite refresh planner statistics gathered over this connection
+            self._conn.execute('PRAGMA optimize')
+            self._conn.close()
+            self._conn = None
     
     def _initialize_database(self):
         """Create database tables if they don't exist - matches legacy structure"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
-            # Create job_runs table
-            cursor.execute('''
+            # WAL lets readers proceed during writes and avoids a full fsync per commit
+            cursor.execute('PRAGMA journal_mode=WAL')
+            
+            # Create all tables in one script
+            cursor.executescript('''
                 CREATE TABLE IF NOT EXISTS job_runs (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     run_date TIMESTAMP NOT NULL,
@@ -51,11 +191,8 @@ class DatabaseManager:
                     started_at TIMESTAMP,
                     completed_at TIMESTAMP,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Create companies table
-            cursor.execute('''
+                );
+                
                 CREATE TABLE IF NOT EXISTS companies (
                     id TEXT PRIMARY KEY,
                     company_name TEXT NOT NULL UNIQUE,
@@ -65,11 +202,9 @@ class DatabaseManager:
                     company_url TEXT,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Create jobs table with legacy column structure + location fields + company_id + company info
-            cursor.execute('''
+                );
+                
+                -- Legacy column structure + location fields + company_id + company info
                 CREATE TABLE IF NOT EXISTS jobs (
                     id TEXT PRIMARY KEY,
                     company TEXT NOT NULL,
@@ -98,53 +233,57 @@ class DatabaseManager:
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     FOREIGN KEY (run_id) REFERENCES job_runs (id),
                     FOREIGN KEY (company_id) REFERENCES companies (id)
-                )
+                );
+            ''')
+            
+            # Migrate existing tables if needed; user_version records that it already ran
+            cursor.execute('PRAGMA user_version')
+            if cursor.fetchone()[0] < _SCHEMA_VERSION:
+                self._migrate_tables(cursor)
+            
+            # Databases created before the newest indexes need fresh planner statistics
+            cursor.execute('''
+                SELECT COUNT(*) FROM sqlite_master
+                WHERE type = 'index' AND name IN ('idx_jobs_company', 'idx_jobs_run_created')
             ''')
+            needs_analyze = cursor.fetchone()[0] < 2
+            # A database analyzed while still empty has no statistics to plan with
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+            if cursor.fetchone() is None:
+                needs_analyze = True
+            else:
+                cursor.execute('SELECT 1 FROM sqlite_stat1 LIMIT 1')
+                needs_analyze = needs_analyze or cursor.fetchone() is None
             
-            # Migrate existing tables if needed
-            self._migrate_tables(cursor)
+            # Create indexes in one script
+            cursor.executescript('''
+                -- Serves per-run lookups and the run-filtered export's ORDER BY without a sort;
+                -- it covers every run_id-only query, so the old single-column index is dropped
+                CREATE INDEX IF NOT EXISTS idx_jobs_run_created ON jobs(run_id, created_at DESC);
+                DROP INDEX IF EXISTS idx_jobs_run_id;
+                CREATE INDEX IF NOT EXISTS idx_jobs_job_id ON jobs(job_id);
+                CREATE INDEX IF NOT EXISTS idx_jobs_company_id ON jobs(company_id);
+                -- Serves the jobs.company -> companies.company_name join and latest-posting lookups
+                CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company, created_at);
+                CREATE INDEX IF NOT EXISTS idx_job_runs_run_date ON job_runs(run_date);
+                CREATE INDEX IF NOT EXISTS idx_companies_name ON companies(company_name);
+            ''')
             
-            # Create indexes
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_run_id ON jobs(run_id)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_job_id ON jobs(job_id)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_company_id ON jobs(company_id)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_job_runs_run_date ON job_runs(run_date)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_companies_name ON companies(company_name)')
+            if needs_analyze:
+                cursor.execute('ANALYZE')
     
     def _migrate_tables(self, cursor):
         """Add new columns to existing tables if they don't exist"""
         try:
-            # Check if location column exists
             cursor.execute("PRAGMA table_info(jobs)")
-            columns = [column[1] for column in cursor.fetchall()]
-            
-            if 'location' not in columns:
-                cursor.execute('ALTER TABLE jobs ADD COLUMN location TEXT')
-                logger.info("Added location column to jobs table")
-            
-            if 'work_location_type' not in columns:
-                cursor.execute('ALTER TABLE jobs ADD COLUMN work_location_type TEXT')
-                logger.info("Added work_location_type column to jobs table")
-            
-            if 'company_id' not in columns:
-                cursor.execute('ALTER TABLE jobs ADD COLUMN company_id TEXT')
-                logger.info("Added company_id column to jobs table")
-            
-            if 'company_size' not in columns:
-                cursor.execute('ALTER TABLE jobs ADD COLUMN company_size TEXT')
-                logger.info("Added company_size column to jobs table")
+            columns = {column[1] for column in cursor.fetchall()}
             
-            if 'company_followers' not in columns:
-                cursor.execute('ALTER TABLE jobs ADD COLUMN company_followers TEXT')
-                logger.info("Added company_followers column to jobs table")
+            for column in _MIGRATED_JOB_COLUMNS:
+                if column not in columns:
+                    cursor.execute(f'ALTER TABLE jobs ADD COLUMN {column} TEXT')
+                    logger.info(f"Added {column} column to jobs table")
             
-            if 'company_industry' not in columns:
-                cursor.execute('ALTER TABLE jobs ADD COLUMN company_industry TEXT')
-                logger.info("Added company_industry column to jobs table")
-            
-            if 'company_info_link' not in columns:
-                cursor.execute('ALTER TABLE jobs ADD COLUMN company_info_link TEXT')
-                logger.info("Added company_info_link column to jobs table")
+            cursor.execute(f'PRAGMA user_version = {_SCHEMA_VERSION}')
                 
         except Exception as e:
             logger.warning(f"Migration warning: {e}")
@@ -180,38 +319,17 @@ class DatabaseManager:
                 WHERE id = ?
             ''', (status, job_count, error_message, datetime.now(), run_id))
     
-    def save_job(self, job: Job) -> int:
-        """Save job to database"""
+    def save_job(self, job: Job) -> Optional[int]:
+        """Save job to database, returning its rowid or None if the job was already stored"""
         try:
-            # Convert job to dict for database insertion
-            job_data = job.to_dict()
-            
-            # Define the INSERT query
-            query = """
-                INSERT INTO jobs (
-                    id, company, title, location, work_location_type,
-                    level, salary_range, content, employment_type, job_function,
-                    industries, posted_time, applicants, job_id, date,
-                    parsing_link, job_posting_link, run_id, company_id,
-                    company_size, company_followers, company_industry, company_info_link
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            
-            values = (
-                job_data['id'], job_data['company'], job_data['title'],
-                job_data['location'], job_data['work_location_type'],
-                job_data['level'], job_data['salary_range'], job_data['content'],
-                job_data['employment_type'], job_data['job_function'],
-                job_data['industries'], job_data['posted_time'], job_data['applicants'],
-                job_data['job_id'], job_data['date'], job_data['parsing_link'],
-                job_data['job_posting_link'], job_data['run_id'], job_data['company_id'],
-                job_data['company_size'], job_data['company_followers'],
-                job_data['company_industry'], job_data['company_info_link']
-            )
+            values = _job_values(job)
             
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(query, values)
+                cursor.execute(_INSERT_JOBS_IGNORE_SQL, values)
+                if cursor.rowcount == 0:
+                    logger.debug(f"Job {job.id} already stored, skipping")
+                    return None
                 return cursor.lastrowid
             
         except sqlite3.Error as e:
@@ -222,48 +340,48 @@ class DatabaseManager:
             raise
     
     def save_company(self, company: Company) -> str:
-        """Save a company to the database"""
-        company_dict = company.to_dict()
-        
+        """Save a company to the database, merging into an existing record with the same name"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            
-            # Check if company already exists by name
-            cursor.execute('''
-                SELECT id FROM companies WHERE company_name = ?
-            ''', (company.company_name,))
-            
-            existing = cursor.fetchone()
-            if existing:
-                # Update existing company with new information
-                cursor.execute('''
-                    UPDATE companies 
-                    SET company_size = COALESCE(?, company_size),
-                        followers = COALESCE(?, followers),
-                        industry = COALESCE(?, industry),
-                        company_url = COALESCE(?, company_url),
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE company_name = ?
-                ''', (
-                    company.company_size, company.followers, company.industry,
-                    company.company_url, company.company_name
-                ))
-                logger.debug(f"Updated company {company.company_name}")
-                return existing['id']
-            
-            # Insert new company
-            cursor.execute('''
-                INSERT INTO companies (
-                    id, company_name, company_size, followers, industry, company_url
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
-                company_dict['id'], company_dict['company_name'], 
-                company_dict['company_size'], company_dict['followers'],
-                company_dict['industry'], company_dict['company_url']
+            cursor.execute(_UPSERT_COMPANY_SQL + ' RETURNING id', (
+                company.id, company.company_name, company.company_size,
+                company.followers, company.industry, company.company_url
             ))
-            
+            company_id = cursor.fetchone()[0]
+        
+        if company_id == company.id:
             logger.info(f"Saved new company: {company.company_name}")
-            return company.id
+        else:
+            logger.debug(f"Updated company {company.company_name}")
+        return company_id
+    
+    def save_companies_bulk(self, company_names: List[str]) -> int:
+        """Create basic company records for many names in a single transaction"""
+        rows = [(Company(company_name=name).id, name) for name in company_names]
+        
+        with self.batch_transaction() as conn:
+            cursor = conn.cursor()
+            cursor.executemany('''
+                INSERT OR IGNORE INTO companies (id, company_name) VALUES (?, ?)
+            ''', rows)
+            created = cursor.rowcount
+        
+        logger.info(f"Saved {created} new companies in bulk")
+        return created
+    
+    def save_companies(self, companies: List[Company]) -> int:
+        """Upsert many companies by name in a single transaction, with the same merge rules as save_company"""
+        rows = [
+            (c.id, c.company_name, c.company_size, c.followers, c.industry, c.company_url)
+            for c in companies
+        ]
+        
+        with self.batch_transaction() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(_UPSERT_COMPANY_SQL, rows)
+        
+        logger.info(f"Saved {len(rows)} companies in one batch")
+        return len(rows)
     
     def get_company_by_name(self, company_name: str) -> Optional[Dict[str, Any]]:
         """Get company by name"""
@@ -273,6 +391,22 @@ class DatabaseManager:
             result = cursor.fetchone()
             return dict(result) if result else None
     
+    def get_companies_by_names(self, company_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get companies keyed by name using batched IN queries"""
+        companies = {}
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(company_names), 500):
+                chunk = company_names[start:start + 500]
+                placeholders = ', '.join('?' * len(chunk))
+                cursor.execute(
+                    f'SELECT * FROM companies WHERE company_name IN ({placeholders})', chunk
+                )
+                for row in cursor.fetchall():
+                    companies[row['company_name']] = dict(row)
+        return companies
+    
     def get_all_companies(self) -> List[Dict[str, Any]]:
         """Get all companies"""
         with self.get_connection() as conn:
@@ -280,8 +414,25 @@ class DatabaseManager:
             cursor.execute('SELECT * FROM companies ORDER BY company_name')
             return [dict(row) for row in cursor.fetchall()]
     
+    def get_company_count(self) -> int:
+        """Get the number of companies without loading their rows"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT COUNT(*) FROM companies')
+            return cursor.fetchone()[0]
+    
     def save_jobs_batch(self, jobs: List[Job]) -> int:
-        """Save multiple jobs in a batch"""
+        """Save multiple jobs in one transaction, skipping ids already stored"""
+        rows = [_job_values(job) for job in jobs]
+        
+        try:
+            with self.batch_transaction() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(_INSERT_JOBS_IGNORE_SQL, rows)
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.warning(f"Batch insert failed, saving jobs one by one: {e}")
+        
         saved_count = 0
         for job in jobs:
             try:
@@ -310,60 +461,36 @@ class DatabaseManager:
             ''', (limit,))
             return [dict(row) for row in cursor.fetchall()]
     
+    @staticmethod
+    def _build_jobs_query(run_id: Optional[int] = None) -> Tuple[str, tuple]:
+        """SQL and parameters selecting export columns, newest first, optionally for one run"""
+        if run_id:
+            return _EXPORT_JOBS_BY_RUN_SQL, (run_id,)
+        return _EXPORT_JOBS_SQL, ()
+    
     def export_jobs_to_csv(self, filename: str, run_id: Optional[int] = None) -> str:
-        """Export jobs to CSV including company information"""
-        import pandas as pd
+        """Export jobs to CSV including company information, streaming rows from the cursor"""
+        query, params = self._build_jobs_query(run_id)
+        started = time.perf_counter()
+        exported = 0
         
-        with self.get_connection() as conn:
-            if run_id:
-                query = '''
-                    SELECT id, company, title, location, work_location_type, level, salary_range, content,
-                           employment_type, job_function, industries, posted_time,
-                           applicants, job_id, date, parsing_link, job_posting_link,
-                           company_size, company_followers, company_industry, company_info_link
-                    FROM jobs WHERE run_id = ?
-                    ORDER BY created_at DESC
-                '''
-                df = pd.read_sql_query(query, conn, params=(run_id,))
-            else:
-                query = '''
-                    SELECT id, company, title, location, work_location_type, level, salary_range, content,
-                           employment_type, job_function, industries, posted_time,
-                           applicants, job_id, date, parsing_link, job_posting_link,
-                           company_size, company_followers, company_industry, company_info_link
-                    FROM jobs
-                    ORDER BY created_at DESC
-                '''
-                df = pd.read_sql_query(query, conn)
+        with self.get_connection() as conn, open(filename, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(_EXPORT_COLUMNS)
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            for exported, row in enumerate(cursor, 1):
+                writer.writerow(row)
         
-        df.to_csv(filename, index=False, encoding="utf-8-sig")
+        logger.info(
+            f"Exported {exported} jobs to {filename} in {time.perf_counter() - started:.2f}s"
+        )
         return filename
-        logger.info(f"Exported {len(df)} jobs to {filename}")
     
     def get_all_jobs_as_dataframe(self, run_id: Optional[int] = None):
         """Get all jobs as pandas DataFrame including company information"""
         import pandas as pd
         
+        query, params = self._build_jobs_query(run_id)
         with self.get_connection() as conn:
-            if run_id:
-                query = '''
-                    SELECT id, company, title, location, work_location_type, level, salary_range, content,
-                           employment_type, job_function, industries, posted_time,
-                           applicants, job_id, date, parsing_link, job_posting_link,
-                           company_size, company_followers, company_industry, company_info_link
-                    FROM jobs WHERE run_id = ?
-                    ORDER BY created_at DESC
-                '''
-                df = pd.read_sql_query(query, conn, params=(run_id,))
-            else:
-                query = '''
-                    SELECT id, company, title, location, work_location_type, level, salary_range, content,
-                           employment_type, job_function, industries, posted_time,
-                           applicants, job_id, date, parsing_link, job_posting_link,
-                           company_size, company_followers, company_industry, company_info_link
-                    FROM jobs
-                    ORDER BY created_at DESC
-                '''
-                df = pd.read_sql_query(query, conn)
-        
-        return df
+            return pd.read_sql_query(query, conn, params=params)
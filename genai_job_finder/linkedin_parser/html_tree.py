@@ -0,0 +1,58 @@
+"""
+Page trees for the LinkedIn extractors.
+Pages fetched as raw bytes are parsed with selectolax's Lexbor engine, falling back to
+BeautifulSoup/lxml where selectolax is not installed. Job pages arrive as BeautifulSoup
+documents, so the helpers accept either kind of tree or node.
+"""
+
+from typing import Optional
+
+from bs4 import BeautifulSoup, Tag
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax is only declared for Python versions it ships wheels for
+    LexborHTMLParser = None
+
+
+def build_tree(html: bytes):
+    """Parse a page with Lexbor when available, otherwise BeautifulSoup/lxml"""
+    if LexborHTMLParser is None:
+        # Raw bytes let lxml detect the encoding itself instead of decoding in Python first
+        return BeautifulSoup(html, 'lxml')
+    return LexborHTMLParser(html)
+
+
+def select(tree, selector: str) -> list:
+    """Run a CSS selector against a Lexbor tree/node or a BeautifulSoup document/tag"""
+    if isinstance(tree, Tag):
+        return tree.select(selector)
+    return tree.css(selector)
+
+
+def node_attr(node, name: str) -> Optional[str]:
+    """Attribute value of a Lexbor node or BeautifulSoup tag"""
+    if isinstance(node, Tag):
+        return node.get(name)
+    return node.attributes.get(name)
+
+
+def node_text(node) -> str:
+    """Stripped text content of a Lexbor node or BeautifulSoup tag"""
+    if isinstance(node, Tag):
+        return node.get_text().strip()
+    return node.text().strip()
+
+
+def joined_text(node) -> str:
+    """Text pieces of a Lexbor node or BeautifulSoup tag, each stripped and joined by spaces"""
+    if isinstance(node, Tag):
+        return node.get_text(' ', strip=True)
+    return node.text(separator=' ', strip=True)
+
+
+def page_text(tree) -> str:
+    """Full text content of a Lexbor tree or BeautifulSoup document"""
+    if isinstance(tree, BeautifulSoup):
+        return tree.get_text()
+    return tree.root.text() if tree.root else ''
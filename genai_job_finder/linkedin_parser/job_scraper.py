@@ -5,11 +5,43 @@ import logging
 from typing import List, Dict, Any
 from .parser import LinkedInJobParser
 from .database import DatabaseManager
+from .models import Job
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def _run_search(parser: LinkedInJobParser, params: Dict[str, Any], total_jobs: int) -> List[Job]:
+    """Run one search and return its jobs, logging instead of raising on failure"""
+    logger.info(f"Starting search: {params}")
+    
+    # Extract parameters
+    keywords = params.get("keywords", "")
+    location = params.get("location", "")
+    time_filter = params.get("f_TPR", "r86400")  # default: last 24 hours
+    remote = params.get("remote", False)
+    parttime = params.get("parttime", False)
+    
+    try:
+        # Parse jobs
+        jobs = parser.parse_jobs(
+            search_query=keywords,
+            location=location,
+            total_jobs=total_jobs,
+            time_filter=time_filter,
+            remote=remote,
+            parttime=parttime
+        )
+        
+        logger.info(f"Successfully scraped {len(jobs)} jobs for: {keywords}")
+        return jobs
+        
+    except Exception as e:
+        logger.error(f"Error scraping jobs for {keywords}: {e}")
+        return []
+
+
 def linkedin_job_search(
     search_params: List[Dict[str, Any]],
     total_jobs_per_search: int = 500,
@@ -30,33 +62,10 @@ def linkedin_job_search(
     
     all_jobs = []
     
+    # Searches run one at a time: each already fetches pages and job details concurrently
+    # through the parser's session and caches, which are not shared across searches safely
     for params in search_params:
-        logger.info(f"Starting search: {params}")
-        
-        # Extract parameters
-        keywords = params.get("keywords", "")
-        location = params.get("location", "")
-        time_filter = params.get("f_TPR", "r86400")  # default: last 24 hours
-        remote = params.get("remote", False)
-        parttime = params.get("parttime", False)
-        
-        try:
-            # Parse jobs
-            jobs = parser.parse_jobs(
-                search_query=keywords,
-                location=location,
-                total_jobs=total_jobs_per_search,
-                time_filter=time_filter,
-                remote=remote,
-                parttime=parttime
-            )
-            
-            all_jobs.extend(jobs)
-            logger.info(f"Successfully scraped {len(jobs)} jobs for: {keywords}")
-            
-        except Exception as e:
-            logger.error(f"Error scraping jobs for {keywords}: {e}")
-            continue
+        all_jobs.extend(_run_search(parser, params, total_jobs_per_search))
     
     # Export to CSV
     if all_jobs:
@@ -64,6 +73,9 @@ def linkedin_job_search(
         logger.info(f"Exported {len(all_jobs)} total jobs to {output_file}")
     else:
         logger.warning("No jobs were scraped")
+    
+    # Runs PRAGMA optimize so the next run plans with statistics for what was just inserted
+    database.close()
 
 
 # Example usage matching the legacy code structure
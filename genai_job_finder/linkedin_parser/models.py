@@ -1,8 +1,79 @@
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, time as dt_time, timedelta
 from typing import Optional, Dict, Any
 from enum import Enum
-import uuid
+from operator import attrgetter
+import os
+import threading
+import time
+
+
+# Record ids come from one os.urandom call per _UUID_POOL_SIZE ids instead of one per record
+_UUID_POOL_SIZE = 256
+_uuid_pool = b''
+_uuid_offset = 0
+_uuid_lock = threading.Lock()
+
+
+def _reset_uuid_pool():
+    """Drop the inherited pool so a forked child never reuses its parent's random bytes"""
+    global _uuid_pool, _uuid_offset
+    _uuid_pool = b''
+    _uuid_offset = 0
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_uuid_pool)
+
+
+def _fast_uuid4() -> str:
+    """Random (version 4) UUID string drawn from the pooled random bytes"""
+    global _uuid_pool, _uuid_offset
+    with _uuid_lock:
+        if _uuid_offset >= len(_uuid_pool):
+            _uuid_pool = os.urandom(16 * _UUID_POOL_SIZE)
+            _uuid_offset = 0
+        raw = bytearray(_uuid_pool[_uuid_offset:_uuid_offset + 16])
+        _uuid_offset += 16
+    # Set the RFC 4122 version (4) and variant bits and format directly,
+    # skipping the argument checks of the uuid.UUID constructor
+    raw[6] = (raw[6] & 0x0F) | 0x40
+    raw[8] = (raw[8] & 0x3F) | 0x80
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+# Today's ISO date and the epoch time at which it stops being today (next local midnight)
+_today_cache = ('', 0.0)
+
+
+def _today_iso() -> str:
+    """Local date as YYYY-MM-DD, recomputed only when the day rolls over"""
+    global _today_cache
+    today, expires_at = _today_cache
+    if time.time() >= expires_at:
+        date = datetime.now().date()
+        tomorrow = datetime.combine(date + timedelta(days=1), dt_time.min)
+        today = date.isoformat()
+        _today_cache = (today, tomorrow.timestamp())
+    return today
+
+
+# to_dict keys, in legacy output order; each is also the attribute it is read from
+_JOB_DICT_FIELDS = (
+    'id', 'company', 'title', 'location', 'work_location_type', 'level', 'salary_range',
+    'content', 'employment_type', 'job_function', 'industries', 'posted_time',
+    'applicants', 'job_id', 'date', 'parsing_link', 'job_posting_link', 'run_id',
+    'company_id', 'company_size', 'company_followers', 'company_industry',
+    'company_info_link',
+)
+_job_dict_values = attrgetter(*_JOB_DICT_FIELDS)
+
+_COMPANY_DICT_FIELDS = (
+    'id', 'company_name', 'company_size', 'followers', 'industry', 'company_url',
+    'created_at', 'updated_at',
+)
+_company_dict_values = attrgetter(*_COMPANY_DICT_FIELDS)
 
 
 class JobType(Enum):
@@ -22,7 +93,7 @@ class ExperienceLevel(Enum):
     NOT_SPECIFIED = "Not Applicable"
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     """Represents a job listing from LinkedIn - matches legacy output structure"""
     job_id: str
@@ -55,40 +126,16 @@ class Job:
     def __post_init__(self):
         """Generate UUID if not provided"""
         if self.id is None:
-            self.id = str(uuid.uuid4())
+            self.id = _fast_uuid4()
         if self.date is None:
-            self.date = datetime.now().date().isoformat()
+            self.date = _today_iso()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert job to dictionary for database storage - matches legacy format"""
-        return {
-            'id': self.id,
-            'company': self.company,
-            'title': self.title,
-            'location': self.location,
-            'work_location_type': self.work_location_type,
-            'level': self.level,
-            'salary_range': self.salary_range,
-            'content': self.content,
-            'employment_type': self.employment_type,
-            'job_function': self.job_function,
-            'industries': self.industries,
-            'posted_time': self.posted_time,
-            'applicants': self.applicants,
-            'job_id': self.job_id,
-            'date': self.date,
-            'parsing_link': self.parsing_link,
-            'job_posting_link': self.job_posting_link,
-            'run_id': self.run_id,
-            'company_id': self.company_id,
-            'company_size': self.company_size,
-            'company_followers': self.company_followers,
-            'company_industry': self.company_industry,
-            'company_info_link': self.company_info_link
-        }
-
-
-@dataclass
+        return dict(zip(_JOB_DICT_FIELDS, _job_dict_values(self)))
+
+
+@dataclass(slots=True)
 class Company:
     """Represents company information extracted from LinkedIn"""
     company_name: str
@@ -103,23 +150,14 @@ class Company:
     def __post_init__(self):
         """Generate UUID if not provided"""
         if self.id is None:
-            self.id = str(uuid.uuid4())
+            self.id = _fast_uuid4()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert company to dictionary for database storage"""
-        return {
-            'id': self.id,
-            'company_name': self.company_name,
-            'company_size': self.company_size,
-            'followers': self.followers,
-            'industry': self.industry,
-            'company_url': self.company_url,
-            'created_at': self.created_at,
-            'updated_at': self.updated_at
-        }
-
-
-@dataclass
+        return dict(zip(_COMPANY_DICT_FIELDS, _company_dict_values(self)))
+
+
+@dataclass(slots=True)
 class JobRun:
     """Represents a parsing run session"""
     id: Optional[int] = None
@@ -0,0 +1,57 @@
+"""
+On-disk cache for fetched LinkedIn pages.
+Pages are stored gzip-compressed under the SHA-1 of their URL and expire by file age.
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Company pages change rarely; a week keeps repeated runs off the network
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+
+class PageCache:
+    """Content-addressed cache of raw page bodies with an mtime-based TTL"""
+
+    def __init__(self, directory: Union[str, Path], ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self.directory = Path(directory)
+        self.ttl_seconds = ttl_seconds
+
+    def _path(self, url: str) -> Path:
+        digest = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return self.directory / f"{digest}.html.gz"
+
+    def get(self, url: str) -> Optional[bytes]:
+        """Return the cached body for url, or None if missing or expired"""
+        path = self._path(url)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                return None
+            with gzip.open(path, 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError) as e:
+            logger.debug(f"Ignoring unreadable cache entry for {url}: {e}")
+            return None
+
+    def put(self, url: str, body: bytes):
+        """Store body for url, replacing any previous entry atomically"""
+        path = self._path(url)
+        # Unique per process and thread so concurrent writers of one URL never share a temp file
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with gzip.open(tmp_path, 'wb') as f:
+                f.write(body)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Could not cache page {url}: {e}")
@@ -1,29 +1,96 @@
+import asyncio
 import logging
 import re
-import time
-import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional, Union
 from urllib.parse import quote, urljoin
 
 import requests
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, Tag
 
 from .models import Job, JobType, ExperienceLevel
 from .database import DatabaseManager
 from .company_parser import LinkedInCompanyParser
+from .config import ACCEPT_ENCODING
+from .html_tree import build_tree, node_attr, select
+from .rate_limiter import host_rate_limiter, mount_retrying_adapter
 from ..legacy.utils import text_clean
 
 logger = logging.getLogger(__name__)
 
+# Job detail pages fetched concurrently
+JOB_FETCH_WORKERS = 8
 
-def html_to_markdown(html_content: str) -> str:
-    """Convert HTML content to Markdown format while preserving structure"""
-    if not html_content:
+# Search result pages fetched concurrently over one aiohttp session
+SEARCH_PAGE_WORKERS = 4
+
+# Fetched jobs are written in transactions of this many rows
+JOB_SAVE_BATCH_SIZE = 200
+
+# Whitespace cleanup applied to every converted job description
+_EXTRA_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n+')
+_INLINE_WHITESPACE_RE = re.compile(r'[ \t]+')
+_TRAILING_WHITESPACE_RE = re.compile(r'[ \t]*\n')
+
+# Remote/hybrid indicators. Plain `in` checks beat a fused regex alternation here since each
+# is a fast C substring search; phrases already covered by a shorter keyword checked first
+# ("fully remote", "mix of remote", "flexible location", ...) are left out.
+_REMOTE_KEYWORDS = (
+    'remote', 'work from home', 'wfh', 'telecommute', 'distributed',
+    'anywhere', 'location independent',
+)
+_HYBRID_KEYWORDS = ('hybrid', 'flexible')
+
+# Job columns copied from the company record
+_COMPANY_JOB_FIELDS = ("company_size", "company_followers", "company_industry", "company_info_link")
+
+# Fallback location selectors in priority order, compiled once; select_one stops at the
+# first hit, which for the top-card selectors is near the start of the page
+_LOCATION_PATTERNS = tuple(soupsieve.compile(selector) for selector in (
+    ".topcard__flavor",
+    ".sub-nav-cta__meta-text",
+    "[class*='location']",
+))
+
+
+def _match_work_location(text: str) -> Optional[str]:
+    """Return "Remote" or "Hybrid" for the indicators in lowercased text, remote taking precedence"""
+    for keyword in _REMOTE_KEYWORDS:
+        if keyword in text:
+            return "Remote"
+    for keyword in _HYBRID_KEYWORDS:
+        if keyword in text:
+            return "Hybrid"
+    return None
+
+
+def _parse_search_page(html: bytes) -> List[str]:
+    """Extract the job IDs from one search results page"""
+    # Lexbor when selectolax is installed; only the cards' URN attributes are read
+    cards = select(build_tree(html), "li div.base-card")
+    logger.debug(f"Found {len(cards)} job cards")
+    
+    job_ids = []
+    for card in cards:
+        urn = node_attr(card, "data-entity-urn")
+        if urn:
+            job_ids.append(urn.split(":")[-1])
+    return job_ids
+
+
+def html_to_markdown(html_content: Union[str, Tag]) -> str:
+    """Convert HTML content to Markdown format while preserving structure
+    
+    An already-parsed Tag is converted in place, skipping the serialize/re-parse round trip.
+    """
+    if html_content is None or (isinstance(html_content, str) and not html_content):
         return ""
     
     # Create BeautifulSoup object to parse HTML
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = html_content if isinstance(html_content, Tag) else BeautifulSoup(html_content, 'lxml')
     
     # Convert common HTML tags to Markdown equivalents
     # Handle headings
@@ -79,8 +146,10 @@ def html_to_markdown(html_content: str) -> str:
         else:
             p.unwrap()
     
-    # Handle divs by adding line breaks
-    for div in soup.find_all('div'):
+    # Handle divs by adding line breaks; when the root is itself a div, re-parsed markup would
+    # flatten it (and every nested div) into its text first, which is what leaving them gives
+    root_is_div = isinstance(html_content, Tag) and soup.name == 'div'
+    for div in ([] if root_is_div else soup.find_all('div')):
         div_text = div.get_text().strip()
         if div_text:
             div.replace_with(f"{div_text}\n\n")
@@ -91,9 +160,9 @@ def html_to_markdown(html_content: str) -> str:
     markdown_text = soup.get_text()
     
     # Clean up extra whitespace and line breaks
-    markdown_text = re.sub(r'\n\s*\n\s*\n+', '\n\n', markdown_text)  # Multiple line breaks to double
-    markdown_text = re.sub(r'[ \t]+', ' ', markdown_text)  # Multiple spaces to single
-    markdown_text = re.sub(r'[ \t]*\n', '\n', markdown_text)  # Remove trailing spaces
+    markdown_text = _EXTRA_BLANK_LINES_RE.sub('\n\n', markdown_text)  # Multiple line breaks to double
+    markdown_text = _INLINE_WHITESPACE_RE.sub(' ', markdown_text)  # Multiple spaces to single
+    markdown_text = _TRAILING_WHITESPACE_RE.sub('\n', markdown_text)  # Remove trailing spaces
     markdown_text = markdown_text.strip()
     
     return markdown_text
@@ -108,21 +177,25 @@ class LinkedInJobParser:
     def __init__(self, database: Optional[DatabaseManager] = None):
         self.database = database or DatabaseManager()
         self.company_parser = LinkedInCompanyParser(self.database)
+        # Company columns copied onto jobs, keyed by company name; ids live in the company parser
+        self._company_fields: Dict[str, dict] = {}
+        self._company_fields_lock = threading.Lock()
         self.session = requests.Session()
         self._setup_session()
     
     def _setup_session(self):
-        """Setup requests session with proper headers"""
+        """Setup requests session with proper headers and a retrying connection pool"""
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
             'Cache-Control': 'max-age=0',
         }
         self.session.headers.update(headers)
+        mount_retrying_adapter(self.session)
     
     def parse_jobs(self, search_query: str, location: str = "", total_jobs: int = 500, 
                   time_filter: str = "r86400", remote: bool = False, parttime: bool = False) -> List[Job]:
@@ -153,9 +226,26 @@ class LinkedInJobParser:
     
     def _get_job_ids(self, search_query: str, location: str, total_jobs: int, 
                     time_filter: str, remote: bool, parttime: bool) -> List[str]:
-        """Get job IDs from LinkedIn search results - matches legacy get_job_ids"""
+        """Get job IDs from LinkedIn search results - matches legacy get_job_ids
+        
+        Synchronous wrapper around get_job_ids_async. Code already running an event loop should
+        await get_job_ids_async; if it calls this instead, the fetch runs on its own thread and loop.
+        """
+        search = self.get_job_ids_async(search_query, location, total_jobs, time_filter, remote, parttime)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(search)
+        
+        # asyncio.run cannot nest inside a running loop
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, search).result()
+    
+    async def get_job_ids_async(self, search_query: str, location: str, total_jobs: int,
+                                time_filter: str = "r86400", remote: bool = False,
+                                parttime: bool = False) -> List[str]:
+        """Get unique job IDs from LinkedIn search results, fetching the result pages concurrently"""
         import math
-        from tqdm import tqdm
         
         # Build URL like legacy linkedin_link_constructor
         url = f"{self.BASE_URL}?keywords={search_query.replace(' ', '%20')}"
@@ -169,77 +259,94 @@ class LinkedInJobParser:
         
         url += "&start={}"
         
-        job_ids = []
         pages = math.ceil(total_jobs / 25)  # 25 jobs per page
         
         logger.info(f"Will fetch {pages} pages for up to {total_jobs} jobs")
         logger.info(f"URL template: {url}")
         
-        for i in tqdm(range(0, pages), desc="Getting job IDs"):
-            try:
-                page_url = url.format(i * 25)
-                logger.debug(f"Fetching page {i}: {page_url}")
-                
-                response = self.session.get(page_url, timeout=15)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.text, "html.parser")
-                jobs_on_page = soup.find_all("li")
-                
-                logger.debug(f"Page {i}: Found {len(jobs_on_page)} <li> elements")
-                
-                page_job_ids = []
-                for job in jobs_on_page:
-                    try:
-                        job_id = (
-                            job.find("div", {"class": "base-card"})
-                            .get("data-entity-urn")
-                            .split(":")[-1]
-                        )
-                        page_job_ids.append(job_id)
-                    except:
-                        continue
-                
-                logger.info(f"Page {i}: Extracted {len(page_job_ids)} job IDs")
-                job_ids.extend(page_job_ids)
-                
-                time.sleep(random.uniform(1, 3))
-                
-            except Exception as e:
-                logger.warning(f"Error fetching page {i}: {e}")
-                continue
+        job_ids = await self._get_job_ids_async(url, pages)
         
         unique_job_ids = list(set(job_ids))  # Remove duplicates
         logger.info(f"Total unique job IDs found: {len(unique_job_ids)}")
         return unique_job_ids
     
+    async def _get_job_ids_async(self, url: str, pages: int) -> List[str]:
+        """Fetch every search results page concurrently over one pooled aiohttp session"""
+        import aiohttp
+        from tqdm import tqdm
+        
+        progress = tqdm(total=pages, desc="Getting job IDs")
+        
+        async def fetch_page(http_session, page: int) -> List[str]:
+            page_url = url.format(page * 25)
+            try:
+                logger.debug(f"Fetching page {page}: {page_url}")
+                # Paced by the shared per-host token bucket, backing off on 429s
+                html = await self.company_parser.fetch_page_async(http_session, page_url)
+                # Parse off the event loop so it overlaps the remaining fetches
+                page_job_ids = await asyncio.to_thread(_parse_search_page, html)
+                logger.info(f"Page {page}: Extracted {len(page_job_ids)} job IDs")
+                return page_job_ids
+            except Exception as e:
+                logger.warning(f"Error fetching page {page}: {e}")
+                return []
+            finally:
+                progress.update()
+        
+        connector = aiohttp.TCPConnector(limit_per_host=SEARCH_PAGE_WORKERS)
+        timeout = aiohttp.ClientTimeout(total=15)
+        headers = dict(self.session.headers)
+        try:
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers) as http_session:
+                results = await asyncio.gather(*[fetch_page(http_session, page) for page in range(pages)])
+        finally:
+            progress.close()
+        
+        return [job_id for page_job_ids in results for job_id in page_job_ids]
+    
     def _get_job_data(self, job_ids: List[str], run_id: int) -> List[Job]:
         """Get detailed job data for each job ID - matches legacy get_job_data"""
         from tqdm import tqdm
         
-        jobs = []
         date = datetime.now().date().isoformat()
         
-        for job_id in tqdm(job_ids, desc="Getting job details"):
-            try:
-                job_details_url = self.JOB_DETAILS_URL.format(job_id)
-                response = self.session.get(job_details_url, timeout=15)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.text, "html.parser")
-                
-                job_info = self._extract_job_details(soup, job_id, date, job_details_url, run_id)
-                if job_info:
-                    jobs.append(job_info)
-                    # Save individual job to database
-                    self.database.save_job(job_info)
-                
-                time.sleep(random.uniform(1, 3))
-                
-            except Exception as e:
-                logger.warning(f"Error fetching job {job_id}: {e}")
-                continue
+        # Fetches are I/O-bound and requests releases the GIL while waiting, so overlap them;
+        # the shared per-host token bucket keeps the overall request rate polite
+        # Workers only fetch and extract; saving here groups the inserts into batched commits
+        jobs = []
+        pending = []
+        try:
+            with ThreadPoolExecutor(max_workers=JOB_FETCH_WORKERS) as executor:
+                results = executor.map(lambda job_id: self._get_single_job(job_id, date, run_id), job_ids)
+                for job in tqdm(results, total=len(job_ids), desc="Getting job details"):
+                    if not job:
+                        continue
+                    jobs.append(job)
+                    pending.append(job)
+                    if len(pending) >= JOB_SAVE_BATCH_SIZE:
+                        self.database.save_jobs_batch(pending)
+                        pending = []
+        finally:
+            if pending:
+                self.database.save_jobs_batch(pending)
         
         return jobs
     
+    def _get_single_job(self, job_id: str, date: str, run_id: int) -> Optional[Job]:
+        """Fetch and extract one job posting; _get_job_data saves it"""
+        try:
+            job_details_url = self.JOB_DETAILS_URL.format(job_id)
+            host_rate_limiter(job_details_url).acquire()
+            response = self.session.get(job_details_url, timeout=15)
+            response.raise_for_status()
+            soup = BeautifulSoup(response.content, "lxml")
+            
+            return self._extract_job_details(soup, job_id, date, job_details_url, run_id)
+            
+        except Exception as e:
+            logger.warning(f"Error fetching job {job_id}: {e}")
+            return None
+    
     def _extract_job_details(self, soup: BeautifulSoup, job_id: str, date: str, 
                            parsing_link: str, run_id: int) -> Optional[Job]:
         """Extract detailed job information from job page - matches legacy extraction"""
@@ -275,13 +382,8 @@ class LinkedInJobParser:
                     job_info["location"] = location_elem.text.strip()
                 else:
                     # Alternative location selectors
-                    location_selectors = [
-                        ".topcard__flavor",
-                        ".sub-nav-cta__meta-text",
-                        "[class*='location']"
-                    ]
-                    for selector in location_selectors:
-                        elem = soup.select_one(selector)
+                    for pattern in _LOCATION_PATTERNS:
+                        elem = pattern.select_one(soup)
                         if elem:
                             job_info["location"] = elem.text.strip()
                             break
@@ -294,58 +396,76 @@ class LinkedInJobParser:
             job_info["work_location_type"] = self._determine_work_location_type(soup, job_info.get("location", ""))
             
             # Get or enrich company information using lookup-first approach
-            company_id = None
-            try:
-                # First, check if company exists in database
-                existing_company = self.database.get_company_by_name(job_info["company"])
-                
-                if existing_company:
-                    # Company exists - use existing data
-                    company_id = existing_company['id']
-                    job_info["company_size"] = existing_company.get('company_size')
-                    job_info["company_followers"] = existing_company.get('followers')
-                    job_info["company_industry"] = existing_company.get('industry')
-                    job_info["company_info_link"] = existing_company.get('company_url')
-                    logger.debug(f"Using existing company data for: {job_info['company']}")
-                    
-                    # Only parse company info if the existing record lacks key information
-                    needs_enrichment = not any([
-                        existing_company.get('company_size'),
-                        existing_company.get('followers'),
-                        existing_company.get('industry'),
-                        existing_company.get('company_url')
-                    ])
+            company_id = self.company_parser.cached_company_id(job_info["company"])
+            with self._company_fields_lock:
+                company_fields = self._company_fields.get(job_info["company"])
+            if company_id and company_fields:
+                # Company already resolved by an earlier job in this session
+                job_info.update(company_fields)
+            else:
+                company_id = None
+                try:
+                    # First, check if company exists in database
+                    existing_company = self.database.get_company_by_name(job_info["company"])
                     
-                    if needs_enrichment:
-                        logger.debug(f"Company {job_info['company']} needs enrichment, parsing...")
+                    if existing_company:
+                        # Company exists - use existing data
+                        company_id = existing_company['id']
+                        job_info["company_size"] = existing_company.get('company_size')
+                        job_info["company_followers"] = existing_company.get('followers')
+                        job_info["company_industry"] = existing_company.get('industry')
+                        job_info["company_info_link"] = existing_company.get('company_url')
+                        logger.debug(f"Using existing company data for: {job_info['company']}")
+                        
+                        # Only parse company info if the existing record lacks key information
+                        needs_enrichment = not any([
+                            existing_company.get('company_size'),
+                            existing_company.get('followers'),
+                            existing_company.get('industry'),
+                            existing_company.get('company_url')
+                        ])
+                        
+                        if needs_enrichment:
+                            logger.debug(f"Company {job_info['company']} needs enrichment, parsing...")
+                            try:
+                                company_info = self.company_parser.extract_company_info_from_job_page(soup, job_info["company"])
+                                if company_info:
+                                    # Update the existing company with new information
+                                    updated_company_id = self.database.save_company(company_info)
+                                    job_info["company_size"] = company_info.company_size
+                                    job_info["company_followers"] = company_info.followers
+                                    job_info["company_industry"] = company_info.industry
+                                    job_info["company_info_link"] = company_info.company_url
+                                    logger.info(f"Enriched existing company: {job_info['company']}")
+                            except Exception as e:
+                                logger.warning(f"Failed to enrich existing company {job_info['company']}: {e}")
+                                # Keep existing (potentially incomplete) data
+                    else:
+                        # Company doesn't exist - create and potentially enrich
+                        logger.debug(f"Creating new company record for: {job_info['company']}")
                         try:
                             company_info = self.company_parser.extract_company_info_from_job_page(soup, job_info["company"])
                             if company_info:
-                                # Update the existing company with new information
-                                updated_company_id = self.database.save_company(company_info)
+                                # Save enriched company information
+                                company_id = self.database.save_company(company_info)
                                 job_info["company_size"] = company_info.company_size
                                 job_info["company_followers"] = company_info.followers
                                 job_info["company_industry"] = company_info.industry
                                 job_info["company_info_link"] = company_info.company_url
-                                logger.info(f"Enriched existing company: {job_info['company']}")
+                                logger.info(f"Created and enriched new company: {job_info['company']}")
+                            else:
+                                # Create basic company record
+                                from .models import Company
+                                basic_company = Company(company_name=job_info["company"])
+                                company_id = self.database.save_company(basic_company)
+                                job_info["company_size"] = None
+                                job_info["company_followers"] = None
+                                job_info["company_industry"] = None
+                                job_info["company_info_link"] = None
+                                logger.debug(f"Created basic company record: {job_info['company']}")
                         except Exception as e:
-                            logger.warning(f"Failed to enrich existing company {job_info['company']}: {e}")
-                            # Keep existing (potentially incomplete) data
-                else:
-                    # Company doesn't exist - create and potentially enrich
-                    logger.debug(f"Creating new company record for: {job_info['company']}")
-                    try:
-                        company_info = self.company_parser.extract_company_info_from_job_page(soup, job_info["company"])
-                        if company_info:
-                            # Save enriched company information
-                            company_id = self.database.save_company(company_info)
-                            job_info["company_size"] = company_info.company_size
-                            job_info["company_followers"] = company_info.followers
-                            job_info["company_industry"] = company_info.industry
-                            job_info["company_info_link"] = company_info.company_url
-                            logger.info(f"Created and enriched new company: {job_info['company']}")
-                        else:
-                            # Create basic company record
+                            logger.warning(f"Failed to extract company info for {job_info['company']}: {e}")
+                            # Create basic company record as fallback
                             from .models import Company
                             basic_company = Company(company_name=job_info["company"])
                             company_id = self.database.save_company(basic_company)
@@ -353,33 +473,29 @@ class LinkedInJobParser:
                             job_info["company_followers"] = None
                             job_info["company_industry"] = None
                             job_info["company_info_link"] = None
-                            logger.debug(f"Created basic company record: {job_info['company']}")
-                    except Exception as e:
-                        logger.warning(f"Failed to extract company info for {job_info['company']}: {e}")
-                        # Create basic company record as fallback
+                            
+                except Exception as e:
+                    logger.error(f"Error processing company info for {job_info['company']}: {e}")
+                    # Create basic company record as final fallback
+                    try:
                         from .models import Company
                         basic_company = Company(company_name=job_info["company"])
                         company_id = self.database.save_company(basic_company)
-                        job_info["company_size"] = None
-                        job_info["company_followers"] = None
-                        job_info["company_industry"] = None
-                        job_info["company_info_link"] = None
-                        
-            except Exception as e:
-                logger.error(f"Error processing company info for {job_info['company']}: {e}")
-                # Create basic company record as final fallback
-                try:
-                    from .models import Company
-                    basic_company = Company(company_name=job_info["company"])
-                    company_id = self.database.save_company(basic_company)
-                except Exception as e2:
-                    logger.error(f"Failed to create basic company record: {e2}")
-                    company_id = None
-                # Set default values
-                job_info["company_size"] = None
-                job_info["company_followers"] = None
-                job_info["company_industry"] = None
-                job_info["company_info_link"] = None
+                    except Exception as e2:
+                        logger.error(f"Failed to create basic company record: {e2}")
+                        company_id = None
+                    # Set default values
+                    job_info["company_size"] = None
+                    job_info["company_followers"] = None
+                    job_info["company_industry"] = None
+                    job_info["company_info_link"] = None
+                
+                if company_id:
+                    self.company_parser.remember_company_id(job_info["company"], company_id)
+                    with self._company_fields_lock:
+                        self._company_fields[job_info["company"]] = {
+                            key: job_info[key] for key in _COMPANY_JOB_FIELDS
+                        }
             
             job_info["company_id"] = company_id
             
@@ -416,8 +532,9 @@ class LinkedInJobParser:
                     "div", {"class": "description__text description__text--rich"}
                 )
                 if desc_elem:
-                    # Use HTML-to-Markdown conversion for better formatting preservation
-                    job_info["content"] = html_to_markdown(str(desc_elem))
+                    # Use HTML-to-Markdown conversion for better formatting preservation;
+                    # the element is converted in place, nothing below reads it
+                    job_info["content"] = html_to_markdown(desc_elem)
                 else:
                     job_info["content"] = ""
             except:
@@ -496,39 +613,10 @@ class LinkedInJobParser:
     
     def _determine_work_location_type(self, soup: BeautifulSoup, location: str) -> str:
         """Determine if job is Remote, Hybrid, or On-site"""
-        # Check the full page content for remote/hybrid indicators
-        page_text = soup.get_text().lower()
-        location_lower = location.lower()
-        
-        # Remote indicators
-        remote_keywords = [
-            'remote', 'work from home', 'wfh', 'telecommute', 'distributed',
-            'anywhere', 'location independent', 'fully remote'
-        ]
-        
-        # Hybrid indicators
-        hybrid_keywords = [
-            'hybrid', 'flexible', 'mix of remote', 'partially remote',
-            'some remote', 'remote friendly', 'flexible location'
-        ]
-        
-        # Check location field first
-        for keyword in remote_keywords:
-            if keyword in location_lower:
-                return "Remote"
-        
-        for keyword in hybrid_keywords:
-            if keyword in location_lower:
-                return "Hybrid"
-        
-        # Check full page content
-        for keyword in remote_keywords:
-            if keyword in page_text:
-                return "Remote"
-        
-        for keyword in hybrid_keywords:
-            if keyword in page_text:
-                return "Hybrid"
+        # Check location field first; LinkedIn often tags it "(Remote)" or "(Hybrid)"
+        work_location_type = _match_work_location(location.lower())
+        if work_location_type:
+            return work_location_type
         
-        # Default to On-site if no remote/hybrid indicators found
-        return "On-site"
+        # Only then build the lowercased full page text for remote/hybrid indicators
+        return _match_work_location(soup.get_text().lower()) or "On-site"
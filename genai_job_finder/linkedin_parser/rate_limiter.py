@@ -0,0 +1,120 @@
+"""
+Token-bucket rate limiting and retry policy for LinkedIn requests.
+Callers only wait when the bucket is empty instead of sleeping after every request.
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Transient statuses retried by the requests session adapter
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# One bucket per host, shared by every parser instance in the process
+_HOST_RATE_LIMITERS: Dict[str, 'TokenBucket'] = {}
+_HOST_RATE_LIMITERS_LOCK = threading.Lock()
+
+
+class TokenBucket:
+    """
+    Token bucket allowing bursts of up to `capacity` requests, refilled at `rate` tokens per second.
+    Safe to share between threads and asyncio tasks.
+    """
+
+    def __init__(self, rate: float = 0.5, capacity: int = 5):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller must wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            if now > self._updated:
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+            self._tokens -= 1
+            # _updated is in the future while the bucket is paused
+            return (self._updated - now) + max(0.0, -self._tokens / self.rate)
+
+    def acquire(self):
+        """Block the calling thread until a token is available"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Wait on the event loop until a token is available"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Drain the bucket and hold every caller for `seconds`, e.g. after an HTTP 429"""
+        with self._lock:
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = max(self._updated, time.monotonic() + seconds)
+
+
+def host_rate_limiter(url: str) -> TokenBucket:
+    """Get the shared token bucket pacing requests to the host of url"""
+    host = urlsplit(url).netloc.lower()
+    with _HOST_RATE_LIMITERS_LOCK:
+        bucket = _HOST_RATE_LIMITERS.get(host)
+        if bucket is None:
+            bucket = _HOST_RATE_LIMITERS[host] = TokenBucket()
+        return bucket
+
+
+def retry_after_seconds(header: Optional[str], attempt: int, backoff_base: float = 2.0) -> float:
+    """
+    Get the delay requested by a Retry-After header, falling back to exponential backoff.
+
+    Args:
+        header: Raw Retry-After value (seconds or HTTP date), if any
+        attempt: Zero-based retry attempt used for the backoff fallback
+        backoff_base: Backoff delay for the first attempt in seconds
+
+    Returns:
+        Number of seconds to wait before retrying
+    """
+    if header:
+        try:
+            return max(0.0, float(header))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(header)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            pass
+    return backoff_base * (2 ** attempt)
+
+
+def mount_retrying_adapter(session: requests.Session, pool_maxsize: int = 32):
+    """
+    Give a requests session a larger keep-alive pool and automatic retries for transient errors.
+
+    Retries back off exponentially and honour Retry-After, so successive LinkedIn fetches reuse
+    the same TCP/TLS connection instead of renegotiating after every politeness delay.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=1.5,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(['GET', 'HEAD']),
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['Keep-Alive'] = 'timeout=30, max=100'
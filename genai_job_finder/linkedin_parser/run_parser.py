@@ -18,7 +18,6 @@ Features:
 
 import argparse
 import logging
-from .parser import LinkedInJobParser
 from .database import DatabaseManager
 from .config import ParserConfig
 
@@ -69,13 +68,16 @@ def main():
     print("   🎯 Job data extraction (20-column output)")
     print("   🏢 Company intelligence (size, followers, industry)")
     print("   📍 Location intelligence & work type classification")
-    print("   🛡️ Smart rate limiting (5-10s delays)")
+    print("   🛡️ Smart rate limiting (per-host token bucket)")
     print("   📤 Automatic CSV export")
     print("   📊 Progress tracking")
     print()
     
+    db = None
     try:
-        # Initialize database and parser
+        # Initialize database and parser; the scraper stack is only imported when a run starts
+        from .parser import LinkedInJobParser
+        
         db = DatabaseManager(args.db_path)
         job_parser = LinkedInJobParser(database=db)
         
@@ -156,6 +158,9 @@ def main():
         print(f"❌ Parsing failed: {e}")
         print(f"💡 Try reducing --total-jobs or check network connection")
         return 1
+    finally:
+        if db is not None:
+            db.close()
     
     return 0
 